@@ -6,55 +6,98 @@ from pathlib import Path
 import re
 
 
-FRONTMATTER_BOUNDARY = re.compile(r"^---\s*$")
-MARKDOWN_LINK = re.compile(r"(!?)\[(?P<text>[^\]]*)\]\((?P<target>[^)]+)\)")
-SKIP_PREFIXES = ("http://", "https://", "mailto:", "#")
+# Leading `---` ... `---` block, located in a single scan instead of a per-line loop.
+FRONTMATTER_BLOCK = re.compile(r"\A---[ \t]*\r?\n(?:.*?\n)??---[ \t]*(?:\r?\n|\Z)", re.S)
+# (bang)[text](target). Text cannot span another opening bracket, targets may hold one
+# level of balanced parentheses (e.g. `foo(1).md`), and the quantifiers are possessive,
+# so failed candidates stay linear on bracket-heavy input.
+MARKDOWN_LINK = re.compile(r"(!?)\[([^\[\]]*+)\]\(((?:[^()]|\([^()]*\))++)\)")
+# Absolute URLs, anchors and root-relative paths are left untouched.
+SKIP_PREFIXES = ("http://", "https://", "mailto:", "#", "/")
 
 
 def strip_frontmatter(raw: str) -> str:
-    lines = raw.splitlines()
-    if not lines or not FRONTMATTER_BOUNDARY.match(lines[0]):
+    if not raw.startswith("---"):
         return raw
-    end_index = None
-    for i in range(1, len(lines)):
-        if FRONTMATTER_BOUNDARY.match(lines[i]):
-            end_index = i
-            break
-    if end_index is None:
+    match = FRONTMATTER_BLOCK.match(raw)
+    if match is None:
         return raw
-    body_lines = lines[end_index + 1 :]
-    return "\n".join(body_lines).lstrip("\n")
+    return raw[match.end() :].lstrip("\n")
 
 
 def rewrite_links(raw: str, readme_path: Path, output_path: Path) -> str:
+    if "](" not in raw:
+        return raw
     readme_dir = readme_path.resolve().parent
     output_dir = output_path.resolve().parent
+    if readme_dir == output_dir:
+        # Relative links already point at the right place.
+        return raw
+    output_parts = output_dir.parts
+    # Links tend to share a handful of directories; resolve each one only once.
+    resolved_parents: dict[str, Path] = {}
+
+    def resolve_target(target: str) -> Path:
+        parent, sep, name = target.rpartition("/")
+        if name in (".", ".."):
+            return (readme_dir / target).resolve()
+        resolved = resolved_parents.get(parent)
+        if resolved is None:
+            resolved = (readme_dir / parent).resolve() if sep else readme_dir
+            resolved_parents[parent] = resolved
+        return resolved / name
 
     def replace(match: re.Match) -> str:
-        bang = match.group(1)
-        text = match.group("text")
-        target = match.group("target").strip()
+        bang, text, target = match.groups()
+        target = target.strip()
 
-        if target.startswith(SKIP_PREFIXES) or target.startswith("/"):
+        if target.startswith(SKIP_PREFIXES):
             return match.group(0)
 
-        source_target = (readme_dir / target).resolve()
-        try:
-            new_target = os.path.relpath(source_target, start=output_dir)
-        except ValueError:
+        target_parts = resolve_target(target).parts
+        common = 0
+        limit = min(len(output_parts), len(target_parts))
+        while common < limit and output_parts[common] == target_parts[common]:
+            common += 1
+        if common == 0:
+            # No shared anchor (e.g. different drives); keep the link as written.
             new_target = target
+        else:
+            up = ("..",) * (len(output_parts) - common)
+            new_target = "/".join(up + target_parts[common:]) or "."
 
         return f"{bang}[{text}]({new_target})"
 
     return MARKDOWN_LINK.sub(replace, raw)
 
 
+def _read_utf8(path: Path) -> str:
+    # One sized read instead of the buffered/text-wrapper read loop.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+def _write_utf8(path: Path, text: str) -> None:
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
 def transform(readme_path: Path, output_path: Path) -> None:
-    raw = readme_path.read_text(encoding="utf-8")
+    raw = _read_utf8(readme_path)
     no_frontmatter = strip_frontmatter(raw)
     rewritten = rewrite_links(no_frontmatter, readme_path, output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(rewritten, encoding="utf-8")
+    if not output_path.parent.is_dir():
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_utf8(output_path, rewritten)
 
 
 def main() -> None:
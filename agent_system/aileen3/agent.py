@@ -1,4 +1,5 @@
 import sys
+from functools import cache
 
 from google.adk.agents.llm_agent import Agent, LlmAgent
 from google.adk.agents.loop_agent import LoopAgent
@@ -8,14 +9,10 @@ from .assistant_loop_exit_agent import AssistantLoopExitAgent
 from .conditional_prep_agent import ConditionalPrepAgent
 from .get_factual_memory_tool import get_factual_memory_tool
 
-from google.adk.tools.mcp_tool import McpToolset
-from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
-from mcp import StdioServerParameters
-
 from env_support import get_env_value
 
 # media tools ("Aileen 3 Core") tools allowlist
-AILEEN3_MCP_TOOL_NAMES = [
+AILEEN3_MCP_TOOL_NAMES: frozenset[str] = frozenset({
     "start_media_retrieval",
     "get_media_retrieval_status",
     "start_media_analysis",
@@ -26,32 +23,63 @@ AILEEN3_MCP_TOOL_NAMES = [
     "start_slide_extraction",
     "get_extracted_slides",
     "translate_slide"
-]
+})
+
+
+def _is_aileen3_mcp_tool(tool, readonly_context=None) -> bool:
+    # ADK only accepts a list or a ToolPredicate as tool_filter; a predicate
+    # keeps the membership check on the frozenset.
+    return tool.name in AILEEN3_MCP_TOOL_NAMES
 
 gemini_api_key = get_env_value("GEMINI_API_KEY")
 env_overrides = {}
 if gemini_api_key:
     env_overrides["GEMINI_API_KEY"] = gemini_api_key
 
-# establish Aileen 3 Core
-aileen3_mcp_toolset = McpToolset(
-    connection_params=StdioConnectionParams(
-        server_params=StdioServerParameters(
-            command=sys.executable,
-            args=["-m", "aileen3_mcp.server"],
-            env=env_overrides or None,
+
+@cache
+def _build_mcp_toolset():
+    """Establish Aileen 3 Core; the MCP client stack is only imported here."""
+    from google.adk.tools.mcp_tool import McpToolset
+    from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+    from mcp import StdioServerParameters
+
+    return McpToolset(
+        connection_params=StdioConnectionParams(
+            server_params=StdioServerParameters(
+                command=sys.executable,
+                args=["-m", "aileen3_mcp.server"],
+                env=env_overrides or None,
+            ),
+            timeout=1200.0,
         ),
-        timeout=1200.0,
-    ),
-    tool_filter=AILEEN3_MCP_TOOL_NAMES,
-)
-
-# core chat & analysis agent based on Gemini 3 Pro
-assi_agent = Agent(
-    model="gemini-3-pro-preview",
-    name="assistant_agent",
-    description="A helpful assistant for user questions named `Aileen`.",
-    instruction="""You are Aileen, an expectation driven briefing assistant for long form talks,
+        tool_filter=_is_aileen3_mcp_tool,
+    )
+
+
+# user briefing fields, filled in by ADK from session state; shared by the
+# assistant and briefing refinement instructions
+_BRIEFING_FIELDS = """    <media_url>
+{user_media_url}
+    </media_url>
+    <context>
+{user_context}
+    </context>
+    <expectations>
+{user_expectations}
+    </expectations>
+    <prior_knowledge>
+{user_prior_knowledge}
+    </prior_knowledge>
+    <questions>
+{user_questions}
+    </questions>
+"""
+_ORIGINAL_USER_BRIEFING = f"<original_user_briefing>\n{_BRIEFING_FIELDS}</original_user_briefing>\n"
+_USER_INPUT_BRIEFING = f"<user_input>\n{_BRIEFING_FIELDS}</user_input>\n"
+
+# core chat & analysis agent instruction
+_ASSISTANT_INSTRUCTION = f"""You are Aileen, an expectation driven briefing assistant for long form talks,
 webinars and conference sessions.
 
 Consistent with the concept of Information Foraging, your job is to help the user forage for signal in noisy content:
@@ -86,39 +114,12 @@ The functions "translate_slide", "start_slide_extraction", and "get_extracted_sl
 
 Treat empty briefing blocks as “not provided by the user” and do not invent content for them.
 
-<original_user_briefing>
-    <media_url>
-{user_media_url}
-    </media_url>
-    <context>
-{user_context}
-    </context>
-    <expectations>
-{user_expectations}
-    </expectations>
-    <prior_knowledge>
-{user_prior_knowledge}
-    </prior_knowledge>
-    <questions>
-{user_questions}
-    </questions>
-</original_user_briefing>
-
+{_ORIGINAL_USER_BRIEFING}
 If you encounter an error while calling the tools or functions, report it to the user.
-""",
-    tools=[
-        get_factual_memory_tool,
-        aileen3_mcp_toolset,
-    ],
-    output_key="assistant_agent_response",
-)
-
-# user briefing refinement agent
-prep_agent = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="briefing_refinement_agent",
-    description="Prepares and refines the initial user briefing.",
-    instruction="""You receive a structured user briefing and must return a cleaned up version.
+"""
+
+# user briefing refinement agent instruction
+_BRIEFING_REFINEMENT_INSTRUCTION = f"""You receive a structured user briefing and must return a cleaned up version.
 
 Your goals are:
 1) Fix spelling mistakes and light grammar issues in the briefing blocks.
@@ -133,24 +134,7 @@ Your goals are:
 3) Do not add new expectations, facts or questions that the user did not supply.
 4) Under no circumstances are you allowed to answer questions or act on the user input.
 
-<user_input>
-    <media_url>
-{user_media_url}
-    </media_url>
-    <context>
-{user_context}
-    </context>
-    <expectations>
-{user_expectations}
-    </expectations>
-    <prior_knowledge>
-{user_prior_knowledge}
-    </prior_knowledge>
-    <questions>
-{user_questions}
-    </questions>
-</user_input>
-
+{_USER_INPUT_BRIEFING}
 Desired output format:
 <user_input>
     <media_url>...</media_url>
@@ -159,19 +143,10 @@ Desired output format:
     <prior_knowledge>...</prior_knowledge>
     <questions>...</questions>
 </user_input>
-""",
-    # Use a dedicated key so downstream agents (or tools)
-    # can detect that refinement has happened and read the
-    # refined form directly from session state.
-    output_key="briefing_refined",
-)
-
-# user follow-up message normalizer and fixer agent
-message_fix_agent = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="message_fix_agent",
-    description="Normalizes and fixes spelling of the latest user message.",
-    instruction="""You receive the latest user message and must return a corrected version.
+"""
+
+# user follow-up message normalizer instruction
+_MESSAGE_FIX_INSTRUCTION = """You receive the latest user message and must return a corrected version.
 
 Your goals are:
 1) Fix obvious spelling mistakes and light grammar issues.
@@ -185,31 +160,94 @@ Desired return format:
 <latest_user_message>
 {latest_user_message}
 </latest_user_message>
-""",
-    output_key="normalized_user_message",
-)
-
-# core agent loop exist guard
-assistant_loop_exit_agent = AssistantLoopExitAgent(
-    watched_agent_name=assi_agent.name,
-    response_state_key="assistant_agent_response",
-)
-
-# core agent loop
-assistant_loop = LoopAgent(
-    name="assistant_agent_loop",
-    sub_agents=[
-        assi_agent,
-        assistant_loop_exit_agent,
-    ],
-    max_iterations=8,
-)
-
-# top-level agent (ADK entry point)
-root_agent = SequentialAgent(
-    name="root_agent",
-    sub_agents=[
-        ConditionalPrepAgent(briefing_agent=prep_agent, message_agent=message_fix_agent),
-        assistant_loop,
-    ],
-)
+"""
+
+# names served by __getattr__ below
+_LAZY_AGENT_NAMES: frozenset[str] = frozenset({
+    "assi_agent",
+    "prep_agent",
+    "message_fix_agent",
+    "assistant_loop_exit_agent",
+    "assistant_loop",
+    "root_agent",
+})
+
+
+@cache
+def _build_agents() -> dict:
+    """Build the agent tree once; this is also where the MCP toolset starts."""
+    # core chat & analysis agent based on Gemini 3 Pro
+    assi_agent = Agent(
+        model="gemini-3-pro-preview",
+        name="assistant_agent",
+        description="A helpful assistant for user questions named `Aileen`.",
+        instruction=_ASSISTANT_INSTRUCTION,
+        tools=[
+            get_factual_memory_tool,
+            _build_mcp_toolset(),
+        ],
+        output_key="assistant_agent_response",
+    )
+
+    # user briefing refinement agent
+    prep_agent = LlmAgent(
+        model="gemini-2.5-flash-lite",
+        name="briefing_refinement_agent",
+        description="Prepares and refines the initial user briefing.",
+        instruction=_BRIEFING_REFINEMENT_INSTRUCTION,
+        # Use a dedicated key so downstream agents (or tools)
+        # can detect that refinement has happened and read the
+        # refined form directly from session state.
+        output_key="briefing_refined",
+    )
+
+    # user follow-up message normalizer and fixer agent
+    message_fix_agent = LlmAgent(
+        model="gemini-2.5-flash-lite",
+        name="message_fix_agent",
+        description="Normalizes and fixes spelling of the latest user message.",
+        instruction=_MESSAGE_FIX_INSTRUCTION,
+        output_key="normalized_user_message",
+    )
+
+    # core agent loop exist guard
+    assistant_loop_exit_agent = AssistantLoopExitAgent(
+        watched_agent_name=assi_agent.name,
+        response_state_key="assistant_agent_response",
+    )
+
+    # core agent loop
+    assistant_loop = LoopAgent(
+        name="assistant_agent_loop",
+        sub_agents=[
+            assi_agent,
+            assistant_loop_exit_agent,
+        ],
+        max_iterations=8,
+    )
+
+    # top-level agent (ADK entry point)
+    root_agent = SequentialAgent(
+        name="root_agent",
+        sub_agents=[
+            ConditionalPrepAgent(briefing_agent=prep_agent, message_agent=message_fix_agent),
+            assistant_loop,
+        ],
+    )
+
+    return {
+        "assi_agent": assi_agent,
+        "prep_agent": prep_agent,
+        "message_fix_agent": message_fix_agent,
+        "assistant_loop_exit_agent": assistant_loop_exit_agent,
+        "assistant_loop": assistant_loop,
+        "root_agent": root_agent,
+    }
+
+
+def __getattr__(name: str):
+    # Module-level agents are built on first access (PEP 562), so importing
+    # this module for discovery does not load the MCP client stack.
+    if name in _LAZY_AGENT_NAMES:
+        return _build_agents()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
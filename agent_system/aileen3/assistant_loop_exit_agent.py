@@ -1,17 +1,35 @@
 from __future__ import annotations
 
 import logging
-from typing import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
 from google.genai import types as genai_types
+from pydantic import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
 DUMMY_SIGNATURE = "context_engineering_is_the_way_to_go"
+_DUMMY_SIGNATURE_BYTES = DUMMY_SIGNATURE.encode("utf-8")
+
+# Upper bound on concurrently tracked invocations (oldest cursors are dropped).
+_MAX_TRACKED_INVOCATIONS = 64
+
+
+@dataclass(slots=True)
+class _ScanCursor:
+    """What one invocation has learned from session.events so far."""
+
+    scanned: int = 0
+    latest: Event | None = None
+    text_since_user: bool = False
+    # Events below this index have not been checked for unsigned function calls.
+    signature_floor: int = 0
+    unsigned_parts: list[genai_types.Part] = field(default_factory=list)
 
 
 class AssistantLoopExitAgent(BaseAgent):
@@ -20,6 +38,8 @@ class AssistantLoopExitAgent(BaseAgent):
     watched_agent_name: str
     response_state_key: str | None
     continue_prompt: str = "continue"
+    # invocation_id -> scan cursor, so each loop iteration only inspects new events.
+    _scan_cursors: dict[str, _ScanCursor] = PrivateAttr(default_factory=dict)
 
     def __init__(
         self, *, watched_agent_name: str, response_state_key: str | None = None
@@ -39,50 +59,55 @@ class AssistantLoopExitAgent(BaseAgent):
     async def _run_async_impl(
         self, ctx: InvocationContext
     ) -> AsyncGenerator[Event, None]:
-        latest = self._latest_event_from_assistant(ctx)
+        watched = self.watched_agent_name
+        state_key = self.response_state_key
+        latest = self._latest_event_from_assistant(ctx, watched)
         if latest is None:
             logger.debug(
                 "AssistantLoopExitAgent: no events found for %s; continuing loop.",
-                self.watched_agent_name,
+                watched,
             )
             return
 
         if not latest.is_final_response():
-            logger.debug(
-                "AssistantLoopExitAgent: latest %s event %s is not final; continuing loop.",
-                self.watched_agent_name,
-                latest.id,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "AssistantLoopExitAgent: latest %s event %s is not final; continuing loop.",
+                    watched,
+                    latest.id,
+                )
             return
 
+        # _latest_event_from_assistant only returns an event for a valid session.
+        state = ctx.session.state
         has_state_response = bool(
-            self.response_state_key
-            and self._has_nonempty_response(ctx, self.response_state_key)
-        )
-        response_text = self._extract_text(latest)
-        has_text_response = bool(
-            response_text.strip() or self._has_text_response_since_last_user(ctx)
+            state_key and self._has_nonempty_response(state, state_key)
         )
+        # `latest` is the newest assistant event after the user's turn, so the
+        # since-last-user check already covers its own text.
+        has_text_response = self._has_text_response_since_last_user(ctx, watched)
 
         if not (has_state_response or has_text_response):
-            patched = self._patch_missing_signatures(ctx)
+            patched = self._patch_missing_signatures(ctx, watched)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    (
+                        "AssistantLoopExitAgent: final %s event %s has no persisted state"
+                        " and no textual response yet; patched %d missing signatures and"
+                        " rerunning without escalating."
+                    ),
+                    watched,
+                    latest.id,
+                    patched,
+                )
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                (
-                    "AssistantLoopExitAgent: final %s event %s has no persisted state"
-                    " and no textual response yet; patched %d missing signatures and"
-                    " rerunning without escalating."
-                ),
-                self.watched_agent_name,
+                "AssistantLoopExitAgent: detected final response from %s (event %s); escalating to stop loop.",
+                watched,
                 latest.id,
-                patched,
             )
-            return
-
-        logger.debug(
-            "AssistantLoopExitAgent: detected final response from %s (event %s); escalating to stop loop.",
-            self.watched_agent_name,
-            latest.id,
-        )
         yield Event(
             invocation_id=ctx.invocation_id,
             author=self.name,
@@ -90,61 +115,136 @@ class AssistantLoopExitAgent(BaseAgent):
         )
 
     def _latest_event_from_assistant(
-        self, ctx: InvocationContext
+        self, ctx: InvocationContext, watched: str
     ) -> Event | None:
         session = ctx.session
         if session is None or not session.events:
             logger.debug(
                 "AssistantLoopExitAgent: session has no events; cannot inspect %s output.",
-                self.watched_agent_name,
+                watched,
             )
             return None
 
-        for event in reversed(session.events):
-            if event.author == self.watched_agent_name:
+        event = self._scan_events(ctx, session.events, watched).latest
+        if event is not None:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "AssistantLoopExitAgent: inspecting event %s from %s.",
                     event.id,
-                    self.watched_agent_name,
+                    watched,
                 )
-                return event
+            return event
         logger.debug(
             "AssistantLoopExitAgent: no events authored by %s found in session history.",
-            self.watched_agent_name,
+            watched,
         )
         return None
 
-    def _has_nonempty_response(
-        self, ctx: InvocationContext, state_key: str
-    ) -> bool:
-        session = ctx.session
-        if session is None or session.state is None:
+    def _scan_events(
+        self, ctx: InvocationContext, events: list[Event], watched: str
+    ) -> _ScanCursor:
+        """Advance this invocation's cursor over events appended since the last call."""
+        # BaseAgent is a pydantic model, so __slots__ cannot replace its field
+        # storage; bind the hot helpers to locals for the loops below.
+        has_text = self._has_nonempty_text
+        collect_unsigned = self._collect_unsigned_parts
+        cursors = self._scan_cursors
+        cursor = cursors.get(ctx.invocation_id)
+        if cursor is None or cursor.scanned > len(events):
+            cursor = _ScanCursor()
+            cursors[ctx.invocation_id] = cursor
+            while len(cursors) > _MAX_TRACKED_INVOCATIONS:
+                del cursors[next(iter(cursors))]
+
+            # First look in this invocation: walk back from the tail only as far
+            # as needed to find the latest assistant event and the last user turn.
+            # Loop state lives in locals and is stored on the cursor afterwards.
+            latest: Event | None = None
+            text_since_user = False
+            seen_user = False
+            unsigned_parts = cursor.unsigned_parts
+            floor = 0
+            for index in range(len(events) - 1, -1, -1):
+                event = events[index]
+                author = event.author
+                if author == "user":
+                    seen_user = True
+                elif author == watched:
+                    if latest is None:
+                        latest = event
+                    if not seen_user and not text_since_user:
+                        text_since_user = has_text(event)
+                    collect_unsigned(event, unsigned_parts)
+                if latest is not None and (seen_user or text_since_user):
+                    floor = index
+                    break
+            cursor.latest = latest
+            cursor.text_since_user = text_since_user
+            cursor.signature_floor = floor
+            cursor.scanned = len(events)
+
+        scanned = cursor.scanned
+        if scanned < len(events):
+            latest = cursor.latest
+            text_since_user = cursor.text_since_user
+            unsigned_parts = cursor.unsigned_parts
+            for index in range(scanned, len(events)):
+                event = events[index]
+                author = event.author
+                if author == "user":
+                    text_since_user = False
+                elif author == watched:
+                    latest = event
+                    if not text_since_user:
+                        text_since_user = has_text(event)
+                    collect_unsigned(event, unsigned_parts)
+            cursor.latest = latest
+            cursor.text_since_user = text_since_user
+            cursor.scanned = len(events)
+        return cursor
+
+    @staticmethod
+    def _collect_unsigned_parts(event: Event, into: list[genai_types.Part]) -> None:
+        content = event.content
+        parts = content.parts if content is not None else None
+        if not parts:
+            return
+        for part in parts:
+            # google-genai defines thought_signature on Part, not FunctionCall.
+            if part.function_call is not None and not part.thought_signature:
+                into.append(part)
+
+    @staticmethod
+    def _has_nonempty_response(state: Any, state_key: str) -> bool:
+        if state is None:
             logger.debug(
-                "AssistantLoopExitAgent: session/state missing; cannot read '%s'.",
+                "AssistantLoopExitAgent: session state missing; cannot read '%s'.",
                 state_key,
             )
             return False
 
-        value = session.state.get(state_key)
+        value = state.get(state_key)
         if value is None:
             return False
         if isinstance(value, str):
             return bool(value.strip())
         return bool(value)
 
-    def _extract_text(self, event: Event) -> str:
-        content = getattr(event, "content", None)
-        parts = getattr(content, "parts", None)
+    @staticmethod
+    def _has_nonempty_text(event: Event) -> bool:
+        """Return True if any text part has non-whitespace content."""
+        # Event/Content/Part are pydantic models, so these fields always exist.
+        content = event.content
+        parts = content.parts if content is not None else None
         if not parts:
-            return ""
-        texts: list[str] = []
+            return False
         for part in parts:
-            text = getattr(part, "text", None)
-            if text:
-                texts.append(text)
-        return "".join(texts)
+            text = part.text
+            if text and not text.isspace():
+                return True
+        return False
 
-    def _patch_missing_signatures(self, ctx: InvocationContext) -> int:
+    def _patch_missing_signatures(self, ctx: InvocationContext, watched: str) -> int:
         """Backfill missing thought_signature bytes on parts that contain function calls.
 
         Some client stacks drop the signature on the Part while still allowing
@@ -156,41 +256,33 @@ class AssistantLoopExitAgent(BaseAgent):
         if session is None or not session.events:
             return 0
 
+        cursor = self._scan_events(ctx, session.events, watched)
+        unsigned_parts = cursor.unsigned_parts
+        if cursor.signature_floor:
+            # Older history was skipped by the tail scan; check it once now.
+            for event in session.events[: cursor.signature_floor]:
+                if event.author == watched:
+                    self._collect_unsigned_parts(event, unsigned_parts)
+            cursor.signature_floor = 0
+
         patched = 0
-        for event in session.events:
-            if event.author != self.watched_agent_name:
+        for part in unsigned_parts:
+            if part.thought_signature:
                 continue
-            content = getattr(event, "content", None)
-            parts = getattr(content, "parts", None)
-            if not parts:
+            try:
+                part.thought_signature = _DUMMY_SIGNATURE_BYTES
+                patched += 1
+            except Exception:
+                # If the SDK model rejects this field, fail soft.
                 continue
-            for part in parts:
-                function_call = getattr(part, "function_call", None)
-                if function_call is None:
-                    continue
-                # google-genai defines thought_signature on Part, not FunctionCall.
-                existing = getattr(part, "thought_signature", None)
-                if existing:
-                    continue
-                try:
-                    part.thought_signature = DUMMY_SIGNATURE.encode("utf-8")
-                    patched += 1
-                except Exception:
-                    # If the SDK model rejects this field, fail soft.
-                    continue
+        unsigned_parts.clear()
         return patched
 
     def _has_text_response_since_last_user(
-        self, ctx: InvocationContext
+        self, ctx: InvocationContext, watched: str
     ) -> bool:
         session = ctx.session
         if session is None or not session.events:
             return False
 
-        for event in reversed(session.events):
-            if event.author == "user":
-                break
-            if event.author == self.watched_agent_name:
-                if self._extract_text(event).strip():
-                    return True
-        return False
+        return self._scan_events(ctx, session.events, watched).text_since_user
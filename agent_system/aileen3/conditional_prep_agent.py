@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
@@ -11,6 +12,53 @@ from google.genai import types as genai_types
 _AGENT_OUTPUT_PREFIX = "<agent_output>"
 _AGENT_OUTPUT_SUFFIX = "</agent_output>"
 
+_STREAM_DONE = object()
+
+
+async def _merge_event_streams(
+    *streams: AsyncGenerator[Event, None],
+) -> AsyncGenerator[Event, None]:
+    """Drain the given event streams concurrently and yield events as they arrive.
+
+    Events from each individual stream keep their relative order. As in ADK's
+    ParallelAgent, each stream pauses after an event until the consumer has
+    resumed this generator, i.e. until the Runner has appended the event to
+    the session and applied its state delta. A failure in any stream is
+    re-raised here and the remaining streams are cancelled.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def drain(stream: AsyncGenerator[Event, None]) -> None:
+        try:
+            async for event in stream:
+                resume = asyncio.Event()
+                queue.put_nowait((event, resume))
+                await resume.wait()
+        except Exception as exc:
+            queue.put_nowait(exc)
+        else:
+            queue.put_nowait(_STREAM_DONE)
+
+    # Plain tasks rather than a TaskGroup: a TaskGroup would cancel whichever
+    # task is consuming this generator, even while it is suspended at a yield.
+    tasks = [asyncio.create_task(drain(stream)) for stream in streams]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is _STREAM_DONE:
+                remaining -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                event, resume = item
+                yield event
+                resume.set()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class ConditionalPrepAgent(BaseAgent):
     """Custom agent that conditionally runs prep work for the assistant.
@@ -45,35 +93,45 @@ class ConditionalPrepAgent(BaseAgent):
     ) -> AsyncGenerator[Event, None]:
         # Session state is the canonical, persisted store across turns.
         state = ctx.session.state
-        state_dict: dict[str, Any] = dict(state) if state is not None else {}
 
         # 1) Run briefing refinement only once per session.
-        has_refined_briefing = "briefing_refined" in state_dict
-
-        if not has_refined_briefing:
-            # Run the underlying LlmAgent once to refine the briefing.
-            # We *must* forward its events so that ADK can apply the
-            # output_key-based state update and, if desired, surface
-            # the content in the transcript.
-            async for event in self.briefing_agent.run_async(ctx):
-                yield event
+        has_refined_briefing = state is not None and "briefing_refined" in state
 
         # 2) On every invocation, normalize the latest user message.
         user_text: str | None = None
         user_content = getattr(ctx, "user_content", None)
-        if user_content is not None and getattr(user_content, "parts", None):
-            for part in user_content.parts:
-                text = getattr(part, "text", None)
-                if text:
-                    user_text = text
-                    break
-
-        if user_text and state is not None:
+        parts = getattr(user_content, "parts", None) if user_content is not None else None
+        if parts:
+            # A user turn is almost always a single text part; check it first.
+            user_text = getattr(parts[0], "text", None) or next(
+                (text for part in parts[1:] if (text := getattr(part, "text", None))),
+                None,
+            )
+        normalize_message = bool(user_text) and state is not None
+        if normalize_message:
             # Make the raw text available for the message fix agent
             # via its prompt template.
             state["latest_user_message"] = user_text
-            # Forward message-fix events as well so its output_key
-            # (`normalized_user_message`) is applied and visible.
+
+        # We *must* forward sub-agent events so that ADK can apply the
+        # output_key-based state updates (`briefing_refined`,
+        # `normalized_user_message`) and, if desired, surface the content
+        # in the transcript.
+        if not has_refined_briefing and normalize_message:
+            # The message fix prompt only reads `latest_user_message`, never
+            # `briefing_refined`, so both LLM calls can be in flight at once.
+            async for event in _merge_event_streams(
+                self.briefing_agent.run_async(ctx),
+                self.message_agent.run_async(ctx),
+            ):
+                yield event
+            return
+
+        if not has_refined_briefing:
+            async for event in self.briefing_agent.run_async(ctx):
+                yield event
+
+        if normalize_message:
             async for event in self.message_agent.run_async(ctx):
                 yield event
 
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
+import weakref
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from google.adk.tools.function_tool import FunctionTool
@@ -29,6 +32,42 @@ _ENV_KEY_ENGINE = ("AGENT_ENGINE_NAME", "AGENT_ENGINE_NAME")
 
 _PAGE_SIZE = 100
 
+# State keys that feed _resolve_settings; their values stamp cached settings.
+_SETTINGS_STATE_KEYS = (
+    _STATE_KEY_PROJECT_ID,
+    _STATE_KEY_LOCATION,
+    _STATE_KEY_ENGINE,
+    _STATE_KEY_API_KEY,
+    _STATE_KEY_APP_NAME,
+    _STATE_KEY_DEFAULT_USER,
+)
+# Env fallbacks used by _resolve_settings; their current values are part of
+# the stamp too, so a fixed .env reaches sessions that already resolved.
+_SETTINGS_ENV_KEYS = (
+    _ENV_KEY_PROJECTS,
+    _ENV_KEY_LOCATIONS,
+    _ENV_KEY_ENGINE,
+    _ENV_KEY_API,
+)
+_SETTINGS_CACHE_SIZE = 256
+
+# Cap on memory lookups running at once, so bursts of tool calls cannot
+# occupy the whole default to_thread pool with blocking pager reads.
+_MAX_CONCURRENT_LOOKUPS = 4
+# One semaphore per event loop: asyncio primitives bind to the loop that first
+# contends on them, and this module outlives loops (e.g. repeated asyncio.run).
+_lookup_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _lookup_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _lookup_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _lookup_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENT_LOOKUPS)
+    return semaphore
+
 
 @dataclass(slots=True)
 class _VertexMemorySettings:
@@ -53,6 +92,8 @@ def _read_state_value(state: Any, key: str) -> str:
 
 
 def _env_lookup(options: tuple[str, ...]) -> str:
+    # Not cached here: env_support caches the parsed .env by mtime and size,
+    # so settings added or fixed after startup are picked up.
     for env_key in options:
         value = get_env_value(env_key)
         if value:
@@ -60,6 +101,7 @@ def _env_lookup(options: tuple[str, ...]) -> str:
     return ""
 
 
+@lru_cache(maxsize=512)
 def _normalize_engine_name(raw_name: str, project: str, location: str) -> str:
     raw_name = raw_name.strip()
     if not raw_name:
@@ -70,6 +112,7 @@ def _normalize_engine_name(raw_name: str, project: str, location: str) -> str:
         return raw_name
     return f"projects/{project}/locations/{location}/reasoningEngines/{raw_name}"
 
+@lru_cache(maxsize=512)
 def _parse_engine_resource(name: str) -> tuple[str | None, str | None]:
     """Return (project, location) when embedded in projects/.../locations/..."""
     if not name or "projects/" not in name or "/locations/" not in name:
@@ -139,16 +182,62 @@ def _resolve_settings(tool_context: ToolContext) -> _VertexMemorySettings:
     )
 
 
+# (session id, user id) -> (state/env stamp, settings resolved from them)
+_settings_cache: dict[tuple[str, str], tuple[tuple[Any, ...], _VertexMemorySettings]] = {}
+
+
+def _cached_settings(tool_context: ToolContext) -> _VertexMemorySettings:
+    """Return settings for this session, re-resolving when its state or env changed."""
+    session_id = getattr(getattr(tool_context, "session", None), "id", None)
+    state = tool_context.state
+    if not session_id or not hasattr(state, "get"):
+        return _resolve_settings(tool_context)
+
+    stamp = tuple(state.get(key) for key in _SETTINGS_STATE_KEYS) + tuple(
+        _env_lookup(options) for options in _SETTINGS_ENV_KEYS
+    )
+    cache_key = (session_id, tool_context.user_id)
+    cached = _settings_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    settings = _resolve_settings(tool_context)
+    _settings_cache.pop(cache_key, None)
+    _settings_cache[cache_key] = (stamp, settings)
+    while len(_settings_cache) > _SETTINGS_CACHE_SIZE:
+        del _settings_cache[next(iter(_settings_cache))]
+    return settings
+
+
+# (project, location, api key) -> client; reused so credentials and channels are set up once.
+_client_cache: dict[tuple[str, str, str | None], Client] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _get_client(settings: _VertexMemorySettings) -> Client:
+    key = (settings.project, settings.location, settings.api_key)
+    client = _client_cache.get(key)
+    if client is not None:
+        return client
+    # Called from worker threads via asyncio.to_thread.
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            if settings.api_key:
+                vertexai.init(project=settings.project, location=settings.location)
+                client = Client(api_key=settings.api_key)
+            else:
+                client = Client(project=settings.project, location=settings.location)
+            _client_cache[key] = client
+    return client
+
+
 def _retrieve_memories(
     *,
     settings: _VertexMemorySettings,
     query: str,
 ) -> str:
-    if settings.api_key:
-        vertexai.init(project=settings.project, location=settings.location)
-        client = Client(api_key=settings.api_key)
-    else:
-        client = Client(project=settings.project, location=settings.location)
+    client = _get_client(settings)
 
     simple_params = vertex_types.RetrieveMemoriesRequestSimpleRetrievalParams(
         page_size=_PAGE_SIZE,
@@ -160,14 +249,14 @@ def _retrieve_memories(
         simple_retrieval_params=simple_params,
     )
 
-    facts: str = ""
+    facts: list[str] = []
     for item in pager:
         memory = getattr(item, "memory", None)
         if not memory or not memory.fact:
             continue
 
         # return flat facts for now. Future improvements could include create_time, update_time, `extract_topics` or (similarity) distance to query
-        facts = f"{facts}<fact>{memory.fact}</fact>"
+        facts.append(f"<fact>{memory.fact}</fact>")
 
     next_page_token = None
     pager_config = getattr(pager, "config", None)
@@ -177,7 +266,7 @@ def _retrieve_memories(
     if not facts:
         return '<memory isError="isError">No factual memories were found</memory>'
     else:
-        return f'<memory>{facts}</memory>'
+        return f'<memory>{"".join(facts)}</memory>'
 
 async def get_factual_memory(
     query: str | None = None,
@@ -210,14 +299,15 @@ async def get_factual_memory(
     if tool_context is None:
         raise ValueError("Tool context is required when calling get_factual_memory.")
     trimmed_query = (query or "").strip()
-    settings = _resolve_settings(tool_context)
+    settings = _cached_settings(tool_context)
 
     try:
-        ret = await asyncio.to_thread(
-            _retrieve_memories,
-            settings=settings,
-            query=trimmed_query,
-        )
+        async with _lookup_semaphore():
+            ret = await asyncio.to_thread(
+                _retrieve_memories,
+                settings=settings,
+                query=trimmed_query,
+            )
         return ret
     except Exception as exc:  # pragma: no cover - surfaced to the LLM/tool log
         message = str(exc)
@@ -49,6 +49,8 @@ class LoggingPlugin(BasePlugin):
         _configure_default_logging(self.logger)
 
     async def before_agent_callback(self, *, agent: Any, callback_context: Any) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         agent_name = getattr(agent, "name", agent.__class__.__name__)
         session_id = callback_context.session.id
         state = getattr(callback_context, "state", None)
@@ -63,6 +65,8 @@ class LoggingPlugin(BasePlugin):
     async def after_agent_callback(
         self, *, agent: Any, callback_context: Any, agent_output: Any | None = None
     ) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         agent_name = getattr(agent, "name", agent.__class__.__name__)
         session_id = callback_context.session.id
         state = getattr(callback_context, "state", None)
@@ -75,6 +79,8 @@ class LoggingPlugin(BasePlugin):
         )
 
     async def before_model_callback(self, *, callback_context: Any, llm_request: Any) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         session_id = callback_context.session.id
         self.logger.info(
             "LLM request session=%s", session_id
@@ -83,6 +89,8 @@ class LoggingPlugin(BasePlugin):
     async def after_model_callback(
         self, *, callback_context: Any, llm_response: Any
     ) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         session_id = callback_context.session.id
         self.logger.info(
             "LLM response session=%s", session_id
@@ -11,6 +11,7 @@ logging plugin + agents directory automatically so the flag cannot be missed.
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from env_support import ensure_env_loaded
@@ -30,8 +31,18 @@ def _load_local_env() -> None:
     ensure_env_loaded(env_path=ROOT_DIR / ".env")
 
 
+@lru_cache(maxsize=1)
 def _load_adk_entrypoint():
     """Return the callable behind the `adk` console script."""
+    try:
+        # google-adk registers `adk = google.adk.cli:main`; importing it directly
+        # skips the scan over every installed distribution's metadata.
+        from google.adk.cli import main as adk_main
+    except ImportError:
+        pass
+    else:
+        return adk_main
+
     entry_points = importlib_metadata.entry_points()
     if hasattr(entry_points, "select"):  # python >=3.10 API
         candidates = entry_points.select(group="console_scripts", name="adk")
@@ -71,13 +82,7 @@ def _consume_extra_plugins(args: list[str]) -> tuple[list[str], list[str]]:
 
 
 def _dedupe_preserve_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for value in values:
-        if value not in seen:
-            seen.add(value)
-            result.append(value)
-    return result
+    return list(dict.fromkeys(values))
 
 
 def _normalize_plugin_name(value: str) -> str:
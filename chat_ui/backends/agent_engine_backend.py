@@ -5,7 +5,7 @@ from dataclasses import dataclass
 
 import vertexai
 
-from .base import AgentBackend
+from .base import AgentBackend, coalesce_partials
 from chat_ui.config import AgentEngineConfig
 
 
@@ -27,7 +27,7 @@ class AgentEngineBackend(AgentBackend):
         self,
         user_id: str,
         existing_session_id: str | None,
-        session_state: dict[str, str],
+        session_state: dict[str, str] | None,
     ) -> str:
         if existing_session_id:
             return existing_session_id
@@ -35,7 +35,20 @@ class AgentEngineBackend(AgentBackend):
         session = await self._adk_app.async_create_session(user_id=user_id, state=session_state)
         return session["id"]
 
-    async def stream_events(
+    def stream_events(
+        self,
+        user_id: str,
+        session_id: str,
+        message: str,
+    ) -> AsyncIterator[dict]:
+        # The producer already filters displayable events; hand its iterator
+        # (or the coalescing wrapper) straight to the caller.
+        return coalesce_partials(
+            self._stream_query(user_id, session_id, message),
+            self.config.stream_coalesce_delay,
+        )
+
+    async def _stream_query(
         self,
         user_id: str,
         session_id: str,
@@ -46,8 +59,11 @@ class AgentEngineBackend(AgentBackend):
             session_id=session_id,
             message=message,
         ):
+            # Downstream predicates assume dict events; drop anything else here.
+            if type(event) is not dict:
+                continue
             # Surface backend-side errors directly to the UI when present.
-            if isinstance(event, dict) and event.get("error"):
+            if event.get("error"):
                 raise RuntimeError(str(event["error"]))
 
             if self._is_displayable_event(event):
@@ -1,35 +1,106 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import httpx
 
-from .base import AgentBackend
+from .base import AgentBackend, coalesce_partials
 from chat_ui.config import ApiServerConfig
 
+try:  # optional fast path: orjson parses and serializes bytes directly
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+try:  # optional: httpx only negotiates HTTP/2 when the h2 package is installed
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+_DATA_PREFIX = b"data:"
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+
+
+def _pop_sse_events(buffer: bytearray) -> list[dict]:
+    """Decode the JSON payload of every complete `data:` line and drop those lines from buffer."""
+    events: list[dict] = []
+    start = 0
+    while (end := buffer.find(b"\n", start)) != -1:
+        # Check the prefix in place so non-data lines are never copied out.
+        is_data = buffer.startswith(_DATA_PREFIX, start, end)
+        line_start, start = start, end + 1
+        if not is_data:
+            continue
+        # The only trailing whitespace SSE produces is the CR of a CRLF ending.
+        data = buffer[line_start + _DATA_PREFIX_LEN : end].lstrip(b" \t").rstrip(b"\r")
+        if not data:
+            continue
+        try:
+            event = _json_loads(data)
+        except ValueError:
+            continue
+        # Downstream predicates assume dict events; drop anything else here.
+        if type(event) is dict:
+            events.append(event)
+    del buffer[:start]
+    return events
+
 
 @dataclass
 class ApiServerBackend(AgentBackend):
     config: ApiServerConfig
+    # One pooled client per backend so keep-alive connections are reused across calls.
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _client_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        async with self._client_lock:
+            if self._client is None:
+                self._client = httpx.AsyncClient(
+                    base_url=self.config.base_url,
+                    timeout=None,
+                    # Lets session creation and /run_sse share one TLS connection.
+                    http2=_HTTP2,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+                )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     async def ensure_session(
         self,
         user_id: str,
         existing_session_id: str | None,
-        session_state: dict[str, str],
+        session_state: dict[str, str] | None,
     ) -> str:
         if existing_session_id:
             return existing_session_id
 
-        base = self.config.base_url.rstrip("/")
-        url = f"{base}/apps/{self.config.app_name}/users/{user_id}/sessions"
+        url = f"/apps/{self.config.app_name}/users/{user_id}/sessions"
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            response = await client.post(url, json={"state": session_state})
-            response.raise_for_status()
-            data = response.json()
+        client = await self._get_client()
+        response = await client.post(
+            url, content=_json_dumps({"state": session_state}), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Session responses from the ADK API server include the id field.
         session_id = data.get("id") or data.get("session_id")
@@ -38,7 +109,20 @@ class ApiServerBackend(AgentBackend):
 
         return session_id
 
-    async def stream_events(
+    def stream_events(
+        self,
+        user_id: str,
+        session_id: str,
+        message: str,
+    ) -> AsyncIterator[dict]:
+        # The producer already filters displayable events; hand its iterator
+        # (or the coalescing wrapper) straight to the caller.
+        return coalesce_partials(
+            self._stream_run_sse(user_id, session_id, message),
+            self.config.stream_coalesce_delay,
+        )
+
+    async def _stream_run_sse(
         self,
         user_id: str,
         session_id: str,
@@ -55,32 +139,33 @@ class ApiServerBackend(AgentBackend):
             "streaming": True
         }
 
-        url = f"{self.config.base_url.rstrip('/')}/run_sse"
-
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("POST", url, json=payload) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-
-                    if not line or not line.startswith("data:"):
-                        continue
-                    data = line[len("data:") :].strip()
-                    if not data:
-                        continue
-                    try:
-                        event = json.loads(data)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Surface backend-side errors directly to the UI.
-                    if isinstance(event, dict) and event.get("error"):
-                        # The ADK API server wraps errors in a top-level "error" field.
-                        # Raise so the UI can present this as a Gradio error.
-                        raise RuntimeError(str(event["error"]))
-                    
-                    # Gate events so only the streaming assistant partials reach the UI.
-                    if self._is_displayable_event(event):
+        client = await self._get_client()
+        body = _json_dumps(payload)
+        async with client.stream(
+            "POST", "/run_sse", content=body, headers=_JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+                for event in _pop_sse_events(buffer):
+                    if self._accept_event(event):
                         yield event
+            # Flush a final line the server did not newline-terminate.
+            buffer += b"\n"
+            for event in _pop_sse_events(buffer):
+                if self._accept_event(event):
+                    yield event
+
+    def _accept_event(self, event: dict) -> bool:
+        # Surface backend-side errors directly to the UI.
+        if event.get("error"):
+            # The ADK API server wraps errors in a top-level "error" field.
+            # Raise so the UI can present this as a Gradio error.
+            raise RuntimeError(str(event["error"]))
+
+        # Gate events so only the streaming assistant partials reach the UI.
+        return self._is_displayable_event(event)
 
     async def delete_session(
         self,
@@ -90,11 +175,10 @@ class ApiServerBackend(AgentBackend):
         if not session_id:
             return
 
-        base = self.config.base_url.rstrip("/")
-        url = f"{base}/apps/{self.config.app_name}/users/{user_id}/sessions/{session_id}"
+        url = f"/apps/{self.config.app_name}/users/{user_id}/sessions/{session_id}"
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            response = await client.delete(url)
-            # Treat missing sessions as already-deleted; raise for other errors.
-            if response.status_code not in (200, 204, 404):
-                response.raise_for_status()
+        client = await self._get_client()
+        response = await client.delete(url)
+        # Treat missing sessions as already-deleted; raise for other errors.
+        if response.status_code not in (200, 204, 404):
+            response.raise_for_status()
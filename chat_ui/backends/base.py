@@ -1,8 +1,126 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 
+# Support both snake_case (ADK python) and camelCase (Vertex / API server)
+_FUNCTION_KEYS = frozenset(
+    {"function_call", "function_response", "functionCall", "functionResponse"}
+)
+_EMPTY: dict = {}
+
+# Upper bound on partials merged into one event, even within the delay window.
+_COALESCE_MAX_PARTS = 16
+
+
+def _text_partial_part(event: dict) -> dict | None:
+    """Return the single text part of a streamed assistant partial, else None."""
+    if event.get("author") != "assistant_agent" or not event.get("partial"):
+        return None
+    parts = (event.get("content") or _EMPTY).get("parts")
+    if not parts or len(parts) != 1:
+        return None
+    part = parts[0]
+    if (
+        not isinstance(part, dict)
+        or not isinstance(part.get("text"), str)
+        or part.get("thought")
+        or not _FUNCTION_KEYS.isdisjoint(part)
+    ):
+        return None
+    return part
+
+
+def _merge_partials(events: list[dict]) -> dict:
+    if len(events) == 1:
+        return events[0]
+    first = events[0]
+    part = dict(first["content"]["parts"][0])
+    part["text"] = "".join(event["content"]["parts"][0]["text"] for event in events)
+    return {**first, "content": {**first["content"], "parts": [part]}}
+
+
+def coalesce_partials(
+    events: AsyncIterator[dict],
+    max_delay: float,
+    max_parts: int = _COALESCE_MAX_PARTS,
+) -> AsyncIterator[dict]:
+    """
+    Merge adjacent assistant text partials that arrive within `max_delay` seconds.
+
+    Every other event flushes the pending text first and is passed through
+    unchanged, so ordering is preserved. The source is advanced in a separate
+    task that is never cancelled on timeout, which keeps the underlying stream
+    intact while a pending batch is flushed. With coalescing disabled the
+    source is returned as-is, without an extra generator frame per event.
+    """
+    if max_delay <= 0:
+        return events
+    return _coalesce_partials(events, max_delay, max_parts)
+
+
+async def _coalesce_partials(
+    events: AsyncIterator[dict],
+    max_delay: float,
+    max_parts: int,
+) -> AsyncIterator[dict]:
+    loop = asyncio.get_running_loop()
+    iterator = aiter(events)
+    pending: list[dict] = []
+    deadline = 0.0
+    next_task: asyncio.Future | None = None
+    try:
+        while True:
+            if next_task is None:
+                next_task = asyncio.ensure_future(anext(iterator))
+            if pending:
+                done, _ = await asyncio.wait(
+                    (next_task,), timeout=max(deadline - loop.time(), 0.0)
+                )
+                if not done:
+                    yield _merge_partials(pending)
+                    pending = []
+                    continue
+            task, next_task = next_task, None
+            try:
+                event = await task
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Deliver text the source already produced before surfacing
+                # its error (e.g. an HTTP failure mid-stream).
+                if pending:
+                    yield _merge_partials(pending)
+                    pending = []
+                raise
+
+            if _text_partial_part(event) is not None:
+                if not pending:
+                    deadline = loop.time() + max_delay
+                pending.append(event)
+                if len(pending) >= max_parts:
+                    yield _merge_partials(pending)
+                    pending = []
+                continue
+
+            if pending:
+                yield _merge_partials(pending)
+                pending = []
+            yield event
+
+        if pending:
+            yield _merge_partials(pending)
+    finally:
+        if next_task is not None:
+            next_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await next_task
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
 
 class AgentBackend(ABC):
     @staticmethod
@@ -12,29 +130,17 @@ class AgentBackend(ABC):
 
         We keep this lightweight and backend-agnostic so both the API server
         and Vertex Agent Engine backends can surface tool usage to the UI.
-        """
-        if not isinstance(event, dict):
-            return False
 
+        Callers only pass dicts; backends drop non-dict payloads when parsing.
+        """
         if event.get("author") != "assistant_agent":
             return False
 
-        content = event.get("content") or {}
-        parts = content.get("parts") or []
+        parts = (event.get("content") or _EMPTY).get("parts")
         if not parts:
             return False
 
-        part = parts[0] or {}
-        # Support both snake_case (ADK python) and camelCase (Vertex / API server)
-        return any(
-            key in part
-            for key in (
-                "function_call",
-                "function_response",
-                "functionCall",
-                "functionResponse",
-            )
-        )
+        return not _FUNCTION_KEYS.isdisjoint(parts[0] or _EMPTY)
 
     @staticmethod
     def _is_displayable_event(event: dict) -> bool:
@@ -44,43 +150,41 @@ class AgentBackend(ABC):
         This includes:
         - Streaming assistant response chunks (partial text)
         - Tool call / tool result events (so the UI can render tool messages)
-        """
-        if not isinstance(event, dict):
-            return False
 
+        Callers only pass dicts; backends drop non-dict payloads when parsing.
+        """
         author = event.get("author")
-        partial = event.get("partial")
 
-        # Streaming text partials from the primary assistant.
-        if author == "assistant_agent" and bool(partial):
-            return True
+        if author == "assistant_agent":
+            # Streaming text partials from the primary assistant.
+            if event.get("partial"):
+                return True
+            # Tool calls and tool responses, which may not be marked as partials.
+            parts = (event.get("content") or _EMPTY).get("parts")
+            return bool(parts) and not _FUNCTION_KEYS.isdisjoint(parts[0] or _EMPTY)
 
         # Synthetic tool-like indicator for the briefing refinement agent:
         # we forward all its events so the UI can emit a spinner-style
         # message while it refines the user's inquiry.
-        if author == "briefing_refinement_agent":
-            return True
-
-        # Tool calls and tool responses, which may not be marked as partials.
-        return AgentBackend._is_tool_event(event)
+        return author == "briefing_refinement_agent"
 
     @abstractmethod
     async def ensure_session(
         self,
         user_id: str,
         existing_session_id: str | None,
-        session_state: dict[str, str],
+        session_state: dict[str, str] | None,
     ) -> str:
-        """Return a session id, creating one if needed."""
+        """Return a session id, creating one (seeded with session_state) if needed."""
 
     @abstractmethod
-    async def stream_events(
+    def stream_events(
         self,
         user_id: str,
         session_id: str,
         message: str,
     ) -> AsyncIterator[dict]:
-        """Yield ADK event dicts for the given user, session, and message."""
+        """Return an async iterator of ADK event dicts for the given user, session, and message."""
 
     async def delete_session(
         self,
@@ -89,3 +193,7 @@ class AgentBackend(ABC):
     ) -> None:
         """Delete a session if supported by the backend."""
         return None
+
+    async def aclose(self) -> None:
+        """Release pooled connections or clients held by the backend."""
+        return None
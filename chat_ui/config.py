@@ -8,20 +8,26 @@ class BackendKind(str, Enum):
     AGENT_ENGINE = "aileen3"
 
 
-@dataclass
+# Window (seconds) for merging adjacent streamed text partials; 0 disables merging.
+DEFAULT_STREAM_COALESCE_DELAY = 0.015
+
+
+@dataclass(slots=True, frozen=True)
 class ApiServerConfig:
     base_url: str
     app_name: str
+    stream_coalesce_delay: float = DEFAULT_STREAM_COALESCE_DELAY
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentEngineConfig:
     project_id: str
     location: str
     agent_engine_name: str
+    stream_coalesce_delay: float = DEFAULT_STREAM_COALESCE_DELAY
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     backend_kind: BackendKind
     api_server: ApiServerConfig | None = None
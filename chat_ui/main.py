@@ -1,11 +1,12 @@
 from env_support import ensure_env_loaded
-from chat_ui.ui.app import build_app
+from chat_ui.ui.app import APP_CSS, backend_lifespan, build_app
 
 
 def main() -> None:
     ensure_env_loaded()
     demo = build_app()
-    demo.launch()
+    # Close pooled backend clients on the serving loop when the server stops.
+    demo.launch(css=APP_CSS, app_kwargs={"lifespan": backend_lifespan})
 
 
 if __name__ == "__main__":
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import io
+import logging
+from collections.abc import AsyncIterator
+from functools import cache
 from typing import List, Tuple, Any
 
 import gradio as gr
 from gradio import ChatMessage
 
 from chat_ui.config import load_config, AppConfig, BackendKind, ApiServerConfig, AgentEngineConfig
-from chat_ui.backends import make_backend
+from chat_ui.backends import AgentBackend, make_backend
 from .event_mapping import (
     init_tool_display_state,
     process_event as process_tool_event,
     get_ordered_tool_messages,
 )
 
-_base_config = load_config()
+logger = logging.getLogger(__name__)
+
+@cache
+def _base_config() -> AppConfig:
+    """Config loaded from the environment, read on first use rather than at import."""
+    return load_config()
 
 
 def _build_settings_accordion() -> tuple[
@@ -35,33 +46,34 @@ def _build_settings_accordion() -> tuple[
     """
     Returns controls for overriding backend settings at runtime and a state object for session id.
     """
+    base_config = _base_config()
     with gr.Accordion("Technical settings", open=False):
         backend_kind = gr.Dropdown(
             label="Backend",
             choices=[BackendKind.API_SERVER.value, BackendKind.AGENT_ENGINE.value],
-            value=_base_config.backend_kind.value,
+            value=base_config.backend_kind.value,
         )
         api_url = gr.Textbox(
             label="API Server URL",
-            value=_base_config.api_server.base_url if _base_config.api_server else "",
+            value=base_config.api_server.base_url if base_config.api_server else "",
             placeholder="http://localhost:8000",
         )
         api_app = gr.Textbox(
             label="API Server App Name",
-            value=_base_config.api_server.app_name if _base_config.api_server else "",
+            value=base_config.api_server.app_name if base_config.api_server else "",
         )
         project_id = gr.Textbox(
             label="Vertex Project ID",
-            value=_base_config.agent_engine.project_id if _base_config.agent_engine else "",
+            value=base_config.agent_engine.project_id if base_config.agent_engine else "",
         )
         location = gr.Textbox(
             label="Vertex Location",
-            value=_base_config.agent_engine.location if _base_config.agent_engine else "",
+            value=base_config.agent_engine.location if base_config.agent_engine else "",
             placeholder="us-central1",
         )
         ae_name = gr.Textbox(
             label="Agent Engine Resource Name",
-            value=_base_config.agent_engine.agent_engine_name if _base_config.agent_engine else "",
+            value=base_config.agent_engine.agent_engine_name if base_config.agent_engine else "",
             placeholder="projects/../reasoningEngines/..",
         )
         vertex_api_key = gr.Textbox(
@@ -71,7 +83,7 @@ def _build_settings_accordion() -> tuple[
         )
         default_user = gr.Textbox(
             label="Default User ID",
-            value=_base_config.default_user_id,
+            value=base_config.default_user_id,
         )
 
     with gr.Accordion("Briefing", open=True):
@@ -128,22 +140,205 @@ def _override_config(
     ae_name: str,
     default_user: str,
 ) -> AppConfig:
+    overrides = (backend_kind, api_url, api_app, project_id, location, ae_name, default_user)
+    if overrides == _base_overrides():
+        # Untouched settings form: reuse the loaded config.
+        return _base_config()
+    return _build_config(*overrides)
+
+
+def _build_config(
+    backend_kind: str,
+    api_url: str,
+    api_app: str,
+    project_id: str,
+    location: str,
+    ae_name: str,
+    default_user: str,
+) -> AppConfig:
+    base_config = _base_config()
     bk = BackendKind(backend_kind)
     if bk == BackendKind.API_SERVER:
         return AppConfig(
             backend_kind=bk,
             api_server=ApiServerConfig(base_url=api_url or "http://localhost:8000", app_name=api_app),
-            default_user_id=default_user or _base_config.default_user_id,
+            default_user_id=default_user or base_config.default_user_id,
         )
     return AppConfig(
         backend_kind=bk,
         agent_engine=AgentEngineConfig(
             project_id=project_id,
-            location=location or (_base_config.agent_engine.location if _base_config.agent_engine else ""),
+            location=location or (base_config.agent_engine.location if base_config.agent_engine else ""),
             agent_engine_name=ae_name,
         ),
-        default_user_id=default_user or _base_config.default_user_id,
+        default_user_id=default_user or base_config.default_user_id,
+    )
+
+
+@cache
+def _base_overrides() -> tuple[str, ...] | None:
+    """Return the settings form's initial values, if they map back to the base config exactly."""
+    base_config = _base_config()
+    api_server = base_config.api_server
+    agent_engine = base_config.agent_engine
+    values = (
+        base_config.backend_kind.value,
+        api_server.base_url if api_server else "",
+        api_server.app_name if api_server else "",
+        agent_engine.project_id if agent_engine else "",
+        agent_engine.location if agent_engine else "",
+        agent_engine.agent_engine_name if agent_engine else "",
+        base_config.default_user_id,
     )
+    return values if _build_config(*values) == base_config else None
+
+
+_QUEUE_CONCURRENCY_LIMIT = 16
+
+# Strong references to fire-and-forget tasks until they finish.
+_background_tasks: set[asyncio.Task] = set()
+
+# Minimum spacing (seconds) between UI updates while a turn is streaming.
+_UI_FLUSH_INTERVAL = 0.05
+# Backend events read ahead of the UI while it renders.
+_STREAM_BUFFER_SIZE = 16
+_STREAM_END = object()
+
+# Backends keyed by the override values, reused across turns so pooled
+# connections and clients survive between messages.
+_BACKEND_CACHE_SIZE = 32
+_backend_cache: dict[tuple[str, ...], tuple[AppConfig, AgentBackend]] = {}
+# Turns currently using each backend, by id(); backends are dataclasses and
+# not hashable.
+_backend_users: dict[int, int] = {}
+# Evicted backends that are still streaming a turn; closed on last release.
+_retired_backends: dict[int, AgentBackend] = {}
+
+
+async def _get_backend(*overrides: str) -> tuple[AppConfig, AgentBackend]:
+    cached = _backend_cache.get(overrides)
+    if cached is not None:
+        return cached
+    config = _override_config(*overrides)
+    # Construction can block (the Agent Engine backend looks up its engine),
+    # so keep it off the event loop that streams other users' turns.
+    backend = await asyncio.to_thread(make_backend, config)
+    # A concurrent miss for the same key may have finished first; keep that one.
+    cached = _backend_cache.setdefault(overrides, (config, backend))
+    if cached[1] is not backend:
+        _spawn_close(backend)
+    while len(_backend_cache) > _BACKEND_CACHE_SIZE:
+        _, evicted = _backend_cache.pop(next(iter(_backend_cache)))
+        if _backend_users.get(id(evicted)):
+            _retired_backends[id(evicted)] = evicted
+        else:
+            _spawn_close(evicted)
+    return cached
+
+
+def _retain_backend(backend: AgentBackend) -> None:
+    """Mark a backend as in use so eviction defers closing it."""
+    key = id(backend)
+    _backend_users[key] = _backend_users.get(key, 0) + 1
+
+
+def _release_backend(backend: AgentBackend) -> None:
+    key = id(backend)
+    remaining = _backend_users.pop(key) - 1
+    if remaining:
+        _backend_users[key] = remaining
+    elif key in _retired_backends:
+        _spawn_close(_retired_backends.pop(key))
+
+
+async def _aclose_backend(backend: AgentBackend) -> None:
+    try:
+        await backend.aclose()
+    except Exception:
+        logger.warning("Failed to close backend %r", backend, exc_info=True)
+
+
+def _spawn_close(backend: AgentBackend) -> None:
+    task = asyncio.create_task(_aclose_backend(backend))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@contextlib.asynccontextmanager
+async def backend_lifespan(app: Any) -> AsyncIterator[None]:
+    """
+    Lifespan for the Gradio server app: close cached backends on shutdown.
+
+    Runs on the serving loop, which is the loop their pooled connections
+    belong to. Pass as `launch(app_kwargs={"lifespan": backend_lifespan})`.
+    """
+    try:
+        yield
+    finally:
+        backends = [backend for _, backend in _backend_cache.values()]
+        backends.extend(_retired_backends.values())
+        _backend_cache.clear()
+        _retired_backends.clear()
+        await asyncio.gather(*(_aclose_backend(backend) for backend in backends))
+
+
+def _render_turn(tool_messages: list[ChatMessage], answer_text: str) -> Any | None:
+    """
+    Build the current assistant-side output for this turn, or None if nothing is visible yet:
+    - one Gradio tool message per tool run (with emoji + status)
+    - plus the natural-language answer text so far (if any).
+    """
+    outputs: list[Any] = [*tool_messages, answer_text] if answer_text else list(tool_messages)
+
+    if not outputs:
+        return None
+    if len(outputs) == 1:
+        return outputs[0]
+    return outputs
+
+
+async def _buffered_with_idle_ticks(
+    events: AsyncIterator[dict], interval: float, buffer_size: int
+) -> AsyncIterator[dict | None]:
+    """
+    Yield events as they arrive, plus None whenever `interval` seconds pass without one.
+
+    A producer task reads ahead into a bounded queue, so the backend stream
+    keeps draining while the consumer is busy rendering or waiting on Gradio.
+    Waiting for a tick only times out the queue read, never the stream itself.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer_size)
+
+    async def produce() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(_STREAM_END)
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), interval)
+            except TimeoutError:
+                yield None
+                continue
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await producer
 
 
 async def chat_fn(
@@ -164,72 +359,112 @@ async def chat_fn(
     prior_knowledge: str,
     questions: str,
 ) -> Tuple[Any, str | None]:
-    config = _override_config(backend_kind, api_url, api_app, project_id, location, ae_name, default_user)
-    active_backend = make_backend(config)
+    config, active_backend = await _get_backend(
+        backend_kind, api_url, api_app, project_id, location, ae_name, default_user
+    )
 
-    user_text = str(message.content if isinstance(message, ChatMessage) else message)
+    user_text = message.content if isinstance(message, ChatMessage) else message
+    if not isinstance(user_text, str):
+        user_text = str(user_text)
 
     user_id = config.default_user_id
 
     # Maintain per-turn state for tool thought messages and streaming text.
     tool_state = init_tool_display_state()
-    answer_text_chunks: list[str] = []
-
-    session_state_payload = {
-        "user_media_url": media_url or "",
-        "user_context": context or "",
-        "user_expectations": expectations or "",
-        "user_prior_knowledge": prior_knowledge or "",
-        "user_questions": questions or "",
-        "vertex_project_id": project_id or "",
-        "vertex_location": location or "",
-        "vertex_agent_engine_name": ae_name or "",
-        "vertex_api_key": vertex_api_key or "",
-        "app_name": api_app or "",
-        "default_user_id": default_user or "",
-    }
-
+    answer_buffer = io.StringIO()
+
+    # Session state is only sent when a new session is created.
+    session_state_payload: dict[str, str] | None = None
+    if not session_id:
+        session_state_payload = {
+            "user_media_url": media_url or "",
+            "user_context": context or "",
+            "user_expectations": expectations or "",
+            "user_prior_knowledge": prior_knowledge or "",
+            "user_questions": questions or "",
+            "vertex_project_id": project_id or "",
+            "vertex_location": location or "",
+            "vertex_agent_engine_name": ae_name or "",
+            "vertex_api_key": vertex_api_key or "",
+            "app_name": api_app or "",
+            "default_user_id": default_user or "",
+        }
+
+    tool_messages: list[ChatMessage] = []
+    tools_revision = tool_state.revision
+
+    def render() -> Any | None:
+        nonlocal tool_messages, tools_revision
+        # Only re-collect tool messages when process_event touched them.
+        if tool_state.revision != tools_revision:
+            tool_messages = get_ordered_tool_messages(tool_state)
+            tools_revision = tool_state.revision
+        return _render_turn(tool_messages, answer_buffer.getvalue())
+
+    did_yield = False
+    # True while received text or tool updates have not been yielded yet.
+    pending = False
+    # No await since _get_backend returned, so the backend cannot have been
+    # evicted yet; from here on eviction defers closing it until release.
+    _retain_backend(active_backend)
     try:
-        did_yield = False
         session_id = await active_backend.ensure_session(
             user_id=user_id,
             existing_session_id=session_id,
             session_state=session_state_payload,
         )
-        async for event in active_backend.stream_events(
-            user_id=user_id,
-            session_id=session_id,
-            message=user_text,
-        ):
-            text_delta = process_tool_event(event, tool_state)
-            if isinstance(text_delta, str) and text_delta:
-                # Stream assistant text as it arrives.
-                answer_text_chunks.append(text_delta)
-
-            # Build the current assistant-side output for this turn:
-            # - one Gradio tool message per tool run (with emoji + status)
-            # - plus the natural-language answer text so far (if any).
-            tool_messages = get_ordered_tool_messages(tool_state)
-            answer_text = "".join(answer_text_chunks)
 
-            outputs: list[Any] = []
-            outputs.extend(tool_messages)
-            if answer_text:
-                outputs.append(answer_text)
+        loop = asyncio.get_running_loop()
+        last_flush = float("-inf")
+        async for event in _buffered_with_idle_ticks(
+            active_backend.stream_events(
+                user_id=user_id,
+                session_id=session_id,
+                message=user_text,
+            ),
+            _UI_FLUSH_INTERVAL,
+            _STREAM_BUFFER_SIZE,
+        ):
+            if event is not None:
+                text_delta = process_tool_event(event, tool_state)
+                if text_delta:
+                    # Stream assistant text as it arrives.
+                    answer_buffer.write(text_delta)
+                elif tool_state.revision == tools_revision and not pending:
+                    # Nothing user-visible changed for this event.
+                    continue
+                pending = True
+                if loop.time() - last_flush < _UI_FLUSH_INTERVAL:
+                    # Batch rapid updates; the next event or idle tick flushes them.
+                    continue
+            elif not pending:
+                continue
 
-            if not outputs:
+            pending = False
+            output = render()
+            if output is None:
                 # Nothing user-visible yet for this event.
                 continue
-
-            if len(outputs) == 1:
-                yield outputs[0], session_id
-            else:
-                yield outputs, session_id
+            last_flush = loop.time()
+            yield output, session_id
             did_yield = True
+
+        if pending:
+            output = render()
+            if output is not None:
+                yield output, session_id
+                did_yield = True
     except Exception as e:
+        if pending:
+            # Flush what already arrived so it stays visible next to the error.
+            output = render()
+            if output is not None:
+                yield output, session_id
         # Show the underlying error message so that backend-originated
         # messages (such as token limit errors) surface cleanly in the UI.
         raise gr.Error(str(e))
+    finally:
+        _release_backend(active_backend)
 
     # If the backend produced no visible events at all for this turn,
     # return an empty assistant reply to avoid StopAsyncIteration errors.
@@ -251,36 +486,54 @@ async def clear_session_fn(
     Clear the backend session (if any) and reset the stored session id.
     """
     if session_id:
-        config = _override_config(backend_kind, api_url, api_app, project_id, location, ae_name, default_user)
-        active_backend = make_backend(config)
-
-        user_id = config.default_user_id
-        try:
-            await active_backend.delete_session(user_id=user_id, session_id=session_id)
-        except Exception:
-            # If deletion fails, we still forget the session id locally so the next
-            # turn will use a fresh session.
-            pass
+        # Delete in the background so the UI clears without waiting on the backend.
+        task = asyncio.create_task(
+            _delete_session(
+                (backend_kind, api_url, api_app, project_id, location, ae_name, default_user),
+                session_id,
+            )
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
     # Forget the session id so the next turn starts fresh.
     return None
 
 
+async def _delete_session(overrides: tuple[str, ...], session_id: str) -> None:
+    try:
+        config, active_backend = await _get_backend(*overrides)
+        _retain_backend(active_backend)
+        try:
+            await active_backend.delete_session(
+                user_id=config.default_user_id, session_id=session_id
+            )
+        finally:
+            _release_backend(active_backend)
+    except Exception:
+        # If deletion fails, the session id is already forgotten locally so the
+        # next turn will use a fresh session.
+        logger.warning("Failed to delete session %s", session_id, exc_info=True)
+
+
+# Remove undo/redo buttons from chatbot. Gradio 6 takes page CSS in launch(),
+# where it becomes a static stylesheet instead of an extra HTML component.
+APP_CSS = """
+button[aria-label*="undo" i],
+button[title*="undo" i],
+button[aria-label*="retry" i],
+button[title*="retry" i] {
+    display: none !important;
+}
+"""
+
+
+@cache
 def build_app() -> gr.Blocks:
+    """Build the Blocks app once per process; later calls return the same instance."""
     with gr.Blocks() as demo:
         gr.Markdown("# Aileen 3 Agent")
 
-        # Remove undo/redo buttons from chatbot
-        gr.HTML("""
-                <style>
-                    button[aria-label*="undo" i],
-                    button[title*="undo" i],
-                    button[aria-label*="retry" i],
-                    button[title*="retry" i] {
-                        display: none !important;
-                    }
-                </style>
-                """)
         chatbot = gr.Chatbot(label="Aileen3 Chat", render_markdown=True)
         (
             backend_kind,
@@ -337,4 +590,7 @@ def build_app() -> gr.Blocks:
             additional_outputs=[session_state],
         )
 
+    # Turns are I/O-bound streams; let several sessions run at once instead of
+    # Gradio's default of one concurrent event per handler.
+    demo.queue(default_concurrency_limit=_QUEUE_CONCURRENCY_LIMIT)
     return demo
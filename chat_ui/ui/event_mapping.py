@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-import base64
 import json
+import re
+from base64 import b64encode
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from gradio import ChatMessage
 
+try:  # optional fast path for parsing and pretty-printing tool payloads
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+    _ORJSON_PRETTY = 0
+    _json_loads = json.loads
+else:
+    _ORJSON_PRETTY = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+    _json_loads = _orjson.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolDisplayState:
     """
     Per-turn state for displaying tool usage as Gradio 'thought' messages.
@@ -25,60 +37,77 @@ class ToolDisplayState:
     fake_progress_ticks: dict[str, int] = field(default_factory=dict)
     # When true, suppress subsequent assistant text chunks for this turn.
     suppress_text: bool = False
+    # Bumped whenever a tool message may have changed, so callers can reuse
+    # the ordered message list between revisions.
+    revision: int = 0
 
 
 def init_tool_display_state() -> ToolDisplayState:
     return ToolDisplayState()
 
 
-def _first_part(event: dict) -> dict[str, Any]:
-    content = event.get("content") or {}
-    parts = content.get("parts") or []
-    if not parts:
-        return {}
-    return parts[0] or {}
-
+# Shared read-only default for missing event and tool payload fields, so
+# misses do not allocate. Never mutate it.
+_EMPTY: dict = {}
 
-def _extract_function_call(part: dict) -> dict | None:
-    # Support both snake_case and camelCase keys.
-    return part.get("function_call") or part.get("functionCall")
 
-
-def _extract_function_response(part: dict) -> dict | None:
-    # Support both snake_case and camelCase keys.
-    return part.get("function_response") or part.get("functionResponse")
+def _first_part(event: dict) -> dict[str, Any]:
+    parts = (event.get("content") or _EMPTY).get("parts")
+    if not parts:
+        return _EMPTY
+    return parts[0] or _EMPTY
 
 
 def _pretty_json(obj: Any) -> str:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_ORJSON_PRETTY).decode("utf-8")
+        except TypeError:
+            # Fall through for values orjson rejects (e.g. >64-bit ints).
+            pass
     try:
         return json.dumps(obj, indent=2, ensure_ascii=False)
     except TypeError:
         return str(obj)
 
 
+@lru_cache(maxsize=256)
 def _snake_to_title(name: str) -> str:
     return " ".join(chunk.capitalize() for chunk in name.split("_") if chunk)
 
 
+_TOOL_LABELS: dict[str, tuple[str, str]] = {
+    "get_factual_memory": ("📚", "Memory lookup"),
+    "start_media_retrieval": ("📺", "Load media"),
+    "start_media_analysis": ("🔍", "Analyze media"),
+    "get_media_analysis_result": ("🔍", "Analyze media"),
+}
+
+
 def _tool_label(name: str) -> tuple[str, str]:
     """
     Return (emoji, human_label) for a tool function name.
     """
-    mapping: dict[str, tuple[str, str]] = {
-        "get_factual_memory": ("📚", "Memory lookup"),
-        "start_media_retrieval": ("📺", "Load media"),
-        "start_media_analysis": ("🔍", "Analyze media"),
-        "get_media_analysis_result": ("🔍", "Analyze media"),
-    }
-    if name in mapping:
-        return mapping[name]
+    label = _TOOL_LABELS.get(name)
+    if label is not None:
+        return label
     # Default: generic wrench + title-cased name.
     return "🛠️", _snake_to_title(name)
 
 
+@lru_cache(maxsize=128)
+def _tool_title(name: str) -> str:
+    """Return the message title for a tool, built once per tool name."""
+    emoji, label = _tool_label(name)
+    return f"{emoji} {label}"
+
+
 def _format_args_markdown(args: dict[str, Any]) -> str:
     if not args:
         return "_No arguments._"
+    if not any(isinstance(value, (dict, list)) for value in args.values()):
+        # Common case: flat scalar arguments need no per-item formatting choice.
+        return "**Input**\n" + "\n".join(f"- **{key}**: {value!s}" for key, value in args.items())
     lines = ["**Input**"]
     for key, value in args.items():
         pretty_value = _pretty_json(value) if isinstance(value, (dict, list)) else str(value)
@@ -91,7 +120,7 @@ def _format_media_analysis_args(args: dict[str, Any]) -> str:
     Pretty formatter for start_media_analysis arguments, especially the priors object.
     """
     reference = args.get("reference")
-    priors = args.get("priors") or {}
+    priors = args.get("priors") or _EMPTY
 
     lines: list[str] = []
     if reference:
@@ -138,16 +167,18 @@ def _parse_text_content(response: dict) -> str | None:
     """
     if not isinstance(response, dict):
         return None
-    content_items = response.get("content") or []
-    for item in content_items:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "text":
-            continue
-        text_value = item.get("text") or ""
-        if text_value:
-            return text_value
-    return None
+    return next(
+        (
+            item["text"]
+            for item in response.get("content") or ()
+            if isinstance(item, dict) and item.get("type") == "text" and item.get("text")
+        ),
+        None,
+    )
+
+
+# A whole payload wrapped in one element: <tag attr="...">inner</tag>.
+_OUTER_XML_RE = re.compile(r"\A\s*<([A-Za-z_][\w\-.]*)[^>]*>(.*)</\1\s*>\s*\Z", re.S)
 
 
 def _strip_simple_xml(text: str) -> str:
@@ -155,12 +186,10 @@ def _strip_simple_xml(text: str) -> str:
     Best-effort stripping of a single <tag ...>value</tag> wrapper.
     Used for get_factual_memory's <memory>...</memory> payloads.
     """
-    start = text.find(">")
-    end = text.rfind("<")
-    if start != -1 and end != -1 and end > start:
-        inner = text[start + 1 : end].strip()
-        return inner or text
-    return text
+    match = _OUTER_XML_RE.match(text)
+    if match is None:
+        return text
+    return match.group(2).strip() or text
 
 
 def _format_get_factual_memory_body(response: dict) -> str:
@@ -179,7 +208,7 @@ def _format_media_retrieval_body(structured: dict) -> str:
     reference = structured.get("reference")
     status_label = structured.get("status")
     cached = structured.get("cached")
-    metadata_block = structured.get("metadata", {}) or {}
+    metadata_block = structured.get("metadata") or _EMPTY
 
     title = metadata_block.get("title")
     source = metadata_block.get("source") or structured.get("source")
@@ -223,7 +252,7 @@ def _data_uri_from(value: Any) -> str | None:
         return None
 
     if isinstance(value, bytes):
-        b64 = base64.b64encode(value).decode("ascii")
+        b64 = b64encode(value).decode("ascii")
         return f"data:image/png;base64,{b64}"
 
     # Handle ImageContent-like objects or dicts
@@ -234,17 +263,15 @@ def _data_uri_from(value: Any) -> str | None:
         data = value.get("data", data)
         mime = value.get("mimeType") or value.get("mime_type") or mime
 
-    if data is None:
-        return None
-
-    if isinstance(data, bytes):
-        b64 = base64.b64encode(data).decode("ascii")
-    else:
-        if isinstance(data, str) and data.startswith("data:"):
+    # Strings are already encoded (or already a data URI); only raw bytes need base64.
+    if isinstance(data, str):
+        if data.startswith("data:"):
             return data
-        if not isinstance(data, str):
-            return None
         b64 = data
+    elif isinstance(data, bytes):
+        b64 = b64encode(data).decode("ascii")
+    else:
+        return None
 
     if not mime:
         mime = "image/png"
@@ -314,16 +341,16 @@ def _image_md_from_data_uri(data_uri: str, alt: str) -> str | None:
     return f'<img src="{data_uri}" alt="{alt}" style="max-width: 100%; width: 768px; height: auto;" />'
 
 
+# Grows over time; purely for entertainment. Index n holds the bar for n+1 ticks.
+_FAKE_PROGRESS_BARS = tuple(f"{'▁▂▃▄▅▆▇█'[:n]} (thinking…) " for n in range(1, 9))
+
+
 def _fake_progress_bar(ticks: int) -> str:
     """
     Return a playful, fake progress indicator based on the number of
     intermediate updates we've seen for a tool.
     """
-    # Grows over time; purely for entertainment.
-    blocks = "▁▂▃▄▅▆▇█"
-    length = min(max(ticks, 1), len(blocks))
-    bar = blocks[:length]
-    return f"{bar} (thinking…) "
+    return _FAKE_PROGRESS_BARS[min(max(ticks, 1), len(_FAKE_PROGRESS_BARS)) - 1]
 
 
 def _format_media_analysis_body(structured: dict, progress_ticks: int | None = None) -> str:
@@ -335,6 +362,7 @@ def _format_media_analysis_body(structured: dict, progress_ticks: int | None = N
     analysis = structured.get("analysis")
 
     lines: list[str] = []
+    has_status = False
 
     if isinstance(analysis, dict):
         # Final, rich analysis payload.
@@ -361,6 +389,7 @@ def _format_media_analysis_body(structured: dict, progress_ticks: int | None = N
 
         if status_label:
             lines.append(f"**Status:** `{status_label}`")
+            has_status = True
         if reference:
             lines.append(f"**Reference:** `{reference}`")
 
@@ -370,15 +399,297 @@ def _format_media_analysis_body(structured: dict, progress_ticks: int | None = N
         else:
             lines.append("_Media analysis in progress..._")
 
-    if status_label and status_label != "done" and not any(
-        l.startswith("**Status:**") for l in lines
-    ):
+    if status_label and status_label != "done" and not has_status:
         # Prepend status badge if still running and not already included.
         lines.insert(0, f"**Status:** `{status_label}`")
 
     return "\n".join(lines)
 
 
+def _respond_factual_memory(
+    msg: ChatMessage, response: dict, structured: dict, state: ToolDisplayState, key: str
+) -> str | None:
+    msg.content = _format_get_factual_memory_body(response)
+    return None
+
+
+def _respond_media_retrieval(
+    msg: ChatMessage, response: dict, structured: dict, state: ToolDisplayState, key: str
+) -> str | None:
+    msg.content = _format_media_retrieval_body(structured)
+    return None
+
+
+def _respond_media_analysis(
+    msg: ChatMessage, response: dict, structured: dict, state: ToolDisplayState, key: str
+) -> str | None:
+    # Increment fake progress ticks for long-running media analysis jobs
+    # so each poll animates the playful progress bar.
+    status_value = structured.get("status")
+    if status_value and status_value != "done":
+        state.fake_progress_ticks[key] = state.fake_progress_ticks.get(key, 0) + 1
+    ticks = state.fake_progress_ticks.get(key)
+    msg.content = _format_media_analysis_body(structured, progress_ticks=ticks)
+    return None
+
+
+def _slide_block(slide: dict) -> str | None:
+    """Return the markdown block (image and caption) for one normalized slide."""
+    uri = slide.get("image_data_uri")
+    if not uri:
+        return None
+    index = slide.get("index")
+    label = (slide.get("label") or "").strip()
+    start = slide.get("from")
+    end = slide.get("to")
+    time_range = ""
+    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+        time_range = f"{int(start)}s–{int(end)}s"
+    caption_parts = []
+    if index is not None:
+        caption_parts.append(f"Slide #{index}")
+    if label:
+        caption_parts.append(label)
+    if time_range:
+        caption_parts.append(time_range)
+    caption = " · ".join(caption_parts)
+
+    # Each block is preceded by a blank line; the leading "\n" supplies it
+    # when the lines are joined.
+    img_md = _image_md_from_data_uri(uri, alt=f"Slide {index}")
+    if img_md and caption:
+        return f"\n{img_md}\n\n{caption}"
+    if img_md:
+        return f"\n{img_md}"
+    if caption:
+        return f"\n{caption}"
+    return None
+
+
+def _respond_slide_extraction(
+    msg: ChatMessage, response: dict, structured: dict, state: ToolDisplayState, key: str
+) -> str | None:
+    # Summarize slide extraction in the tool message, but surface the
+    # actual slide images in the main assistant response instead of
+    # inside the thought.
+    slides = _normalize_slide_entries(structured or response)
+    if not slides:
+        msg.content = "_No slides available for this media._"
+        return None
+
+    msg.content = f"Extracted {len(slides)} slides for this media."
+    # Emit images into the regular assistant turn.
+    lines: list[str] = [f"Detected {len(slides)} slides for this media."]
+    lines.extend(filter(None, map(_slide_block, slides)))
+
+    # After returning the images, suppress any noisy assistant text
+    # the model might produce for this turn.
+    state.suppress_text = True
+    return "\n".join(lines)
+
+
+def _respond_translate_slide(
+    msg: ChatMessage, response: dict, structured: dict, state: ToolDisplayState, key: str
+) -> str | None:
+    # Translate slide returns an ImageContent-like payload. Surface the
+    # translated image in the main assistant response and keep the tool
+    # message itself concise.
+    data_uri: str | None = None
+    if structured:
+        data_uri = _data_uri_from(structured)
+    if not data_uri and isinstance(response, dict):
+        content_items = response.get("content") or ()
+        for item in content_items:
+            if isinstance(item, dict) and item.get("type") == "image":
+                data_uri = _data_uri_from(item)
+                if data_uri:
+                    break
+
+    if not data_uri:
+        msg.content = "_Slide translation completed, but the image payload could not be decoded._"
+        return None
+
+    img_md = _image_md_from_data_uri(data_uri, alt="Translated slide")
+    msg.content = "Translated slide image ready."
+    state.suppress_text = True
+    return img_md or "_Translated slide image available._"
+
+
+def _respond_generic(
+    msg: ChatMessage, response: dict, structured: dict, state: ToolDisplayState, key: str
+) -> str | None:
+    # Generic fallback for other tools: pretty-print payload but avoid
+    # overwhelming users with raw internals when possible.
+    inner = _parse_text_content(response)
+    if inner:
+        try:
+            parsed = _json_loads(inner)
+        except (ValueError, TypeError):
+            # Decode errors subclass ValueError; stdlib json.loads raises
+            # TypeError for a non-str payload.
+            body = inner
+        else:
+            body = f"```json\n{_pretty_json(parsed)}\n```"
+    else:
+        body = f"```json\n{_pretty_json(response)}\n```"
+
+    msg.content = body
+    return None
+
+
+# Tool name -> formatter that fills in the tool message body and optionally
+# returns text for the main assistant response. Other tools use _respond_generic.
+_RESPONSE_HANDLERS = {
+    "get_factual_memory": _respond_factual_memory,
+    "start_media_retrieval": _respond_media_retrieval,
+    "get_media_retrieval_status": _respond_media_retrieval,
+    "start_media_analysis": _respond_media_analysis,
+    "get_media_analysis_result": _respond_media_analysis,
+    "start_slide_extraction": _respond_slide_extraction,
+    "get_extracted_slides": _respond_slide_extraction,
+    "translate_slide": _respond_translate_slide,
+}
+
+
+def _add_tool_message(
+    state: ToolDisplayState, key: str, title: str, content: str, pending: bool = True
+) -> ChatMessage:
+    """
+    Create a tool message and register it in first-seen order.
+
+    With pending=False no status is set; the caller fills it in afterwards.
+    """
+    metadata = {"title": title}
+    if pending:
+        metadata["status"] = "pending"
+    metadata["id"] = key
+    msg = ChatMessage(role="assistant", content=content, metadata=metadata)
+    state.tools_by_key[key] = msg
+    state.tool_order.append(key)
+    return msg
+
+
+_BRIEFING_TITLE = "👩🏻‍🏫 Refining and expanding inquiry"
+
+
+def _process_briefing_event(event: dict, state: ToolDisplayState) -> None:
+    """
+    Briefing refinement agent events.
+
+    We treat these as a synthetic tool call so the UI can show a spinner
+    while the refinement is running, without streaming its raw text.
+    """
+    key = "__briefing_refinement__"
+    msg = state.tools_by_key.get(key)
+    title = _BRIEFING_TITLE
+
+    if msg is None:
+        msg = _add_tool_message(state, key, title, "_Refining and expanding your inquiry..._")
+    # Messages are only ever created here with a metadata dict.
+    metadata = msg.metadata
+    if metadata.get("title") is not title:
+        metadata["title"] = title
+
+    # Mark as done when the refinement agent signals completion. ADK
+    # events typically carry finishReason when a stream ends; fall back
+    # to non-partial events as a completion signal.
+    finish_reason = event.get("finishReason")
+    partial = event.get("partial")
+    if finish_reason == "STOP" or (partial is None or partial is False):
+        metadata["status"] = "done"
+    else:
+        metadata["status"] = "pending"
+
+    # Never surface the refinement agent's own text chunks.
+    return None
+
+
+def _process_function_call(fc: dict, state: ToolDisplayState) -> None:
+    """Tool call events."""
+    tool_name = fc.get("name", "tool")
+    args = fc.get("args") or _EMPTY
+    call_id = fc.get("id") or tool_name
+
+    title = _tool_title(tool_name)
+
+    if tool_name == "start_media_analysis":
+        body = _format_media_analysis_args(args)
+    else:
+        body = _format_args_markdown(args)
+
+    msg = state.tools_by_key.get(call_id)
+    if msg is None:
+        msg = _add_tool_message(state, call_id, title, body)
+    else:
+        # Update args body if we somehow see multiple calls with same id.
+        msg.content = body
+        metadata = msg.metadata
+        if metadata.get("title") is not title:
+            metadata["title"] = title
+        metadata["status"] = "pending"
+
+    # No user-visible text chunk; the thought message itself is streamed
+    # via ChatMessage.
+    return None
+
+
+def _process_function_response(fr: dict, state: ToolDisplayState) -> str | None:
+    """Tool response events."""
+    tool_name = fr.get("name", "tool")
+    response = fr.get("response") or _EMPTY
+    call_id = fr.get("id") or tool_name
+
+    title = _tool_title(tool_name)
+
+    structured = _extract_structured(response) or _EMPTY
+    job_id = structured.get("job_id")
+    status_value = structured.get("status")
+
+    # Work out canonical tool key so that start_* / get_* share one message.
+    canonical_key = call_id
+    if job_id:
+        root = state.job_roots.get(job_id)
+        if root is None:
+            state.job_roots[job_id] = call_id
+        else:
+            canonical_key = root
+
+    msg = state.tools_by_key.get(canonical_key)
+    if msg is None:
+        # We missed the functionCall; create the message on first response.
+        msg = _add_tool_message(state, canonical_key, title, "", pending=False)
+
+    # Update metadata. Every message in tools_by_key is created with a dict.
+    metadata = msg.metadata
+    # Polled jobs hit this on every update; skip the write when unchanged.
+    if metadata.get("title") is not title:
+        metadata["title"] = title
+    if status_value:
+        metadata["status"] = "done" if status_value == "done" else "pending"
+    else:
+        metadata["status"] = "done"
+
+    # Build a nice body depending on the tool.
+    handler = _RESPONSE_HANDLERS.get(tool_name, _respond_generic)
+    return handler(msg, response, structured, state, canonical_key)
+
+
+# Events from these authors are handled as a whole, regardless of their parts.
+_AUTHOR_HANDLERS = {
+    "briefing_refinement_agent": _process_briefing_event,
+}
+
+# First part key -> handler, checked in order. Support both snake_case and
+# camelCase keys.
+_PART_HANDLERS = (
+    ("function_call", _process_function_call),
+    ("functionCall", _process_function_call),
+    ("function_response", _process_function_response),
+    ("functionResponse", _process_function_response),
+)
+_PART_HANDLER_KEYS = frozenset(key for key, _ in _PART_HANDLERS)
+
+
 def process_event(
     event: dict,
     state: ToolDisplayState,
@@ -390,230 +701,25 @@ def process_event(
         A text chunk (for the main assistant response) if this event carries
         user-visible text, otherwise None.
     """
-    author = event.get("author")
-
-    # --- Briefing refinement agent events ---------------------------------
-    # We treat these as a synthetic tool call so the UI can show a spinner
-    # while the refinement is running, without streaming its raw text.
-    if author == "briefing_refinement_agent":
-        key = "__briefing_refinement__"
-        msg = state.tools_by_key.get(key)
-        emoji = "👩🏻‍🏫"
-        label = "Refining and expanding inquiry"
-        title = f"{emoji} {label}"
-
-        if msg is None:
-            msg = ChatMessage(
-                role="assistant",
-                content="_Refining and expanding your inquiry..._",
-                metadata={
-                    "title": title,
-                    "status": "pending",
-                    "id": key,
-                },
-            )
-            state.tools_by_key[key] = msg
-            state.tool_order.append(key)
-        else:
-            if msg.metadata is None:
-                msg.metadata = {}
-            msg.metadata["title"] = title
-
-        # Mark as done when the refinement agent signals completion. ADK
-        # events typically carry finishReason when a stream ends; fall back
-        # to non-partial events as a completion signal.
-        finish_reason = event.get("finishReason")
-        partial = event.get("partial")
-        if finish_reason == "STOP" or (partial is None or partial is False):
-            msg.metadata["status"] = "done"
-        else:
-            msg.metadata["status"] = "pending"
-
-        # Never surface the refinement agent's own text chunks.
-        return None
+    author_handler = _AUTHOR_HANDLERS.get(event.get("author"))
+    if author_handler is not None:
+        state.revision += 1
+        return author_handler(event, state)
 
     part = _first_part(event)
     if not part:
         return None
 
-    # --- Tool call events -------------------------------------------------
-    fc = _extract_function_call(part)
-    if fc:
-        tool_name = fc.get("name", "tool")
-        args = fc.get("args", {}) or {}
-        call_id = fc.get("id") or tool_name
+    # Streamed text chunks far outnumber tool events; return them before
+    # probing each tool key.
+    if "text" in part and _PART_HANDLER_KEYS.isdisjoint(part):
+        return None if state.suppress_text else part["text"]
 
-        emoji, label = _tool_label(tool_name)
-        title = f"{emoji} {label}"
-
-        if tool_name == "start_media_analysis":
-            body = _format_media_analysis_args(args)
-        else:
-            body = _format_args_markdown(args)
-
-        msg = state.tools_by_key.get(call_id)
-        if msg is None:
-            msg = ChatMessage(
-                role="assistant",
-                content=body,
-                metadata={
-                    "title": title,
-                    "status": "pending",
-                    "id": call_id,
-                },
-            )
-            state.tools_by_key[call_id] = msg
-            state.tool_order.append(call_id)
-        else:
-            # Update args body if we somehow see multiple calls with same id.
-            msg.content = body
-            if msg.metadata is not None:
-                msg.metadata["title"] = title
-                msg.metadata["status"] = "pending"
-
-        # No user-visible text chunk; the thought message itself is streamed
-        # via ChatMessage.
-        return None
-
-    # --- Tool response events ---------------------------------------------
-    fr = _extract_function_response(part)
-    if fr:
-        tool_name = fr.get("name", "tool")
-        response = fr.get("response", {}) or {}
-        call_id = fr.get("id") or tool_name
-
-        emoji, label = _tool_label(tool_name)
-        title = f"{emoji} {label}"
-
-        structured = _extract_structured(response) or {}
-        job_id = structured.get("job_id") if isinstance(structured, dict) else None
-        status_value = structured.get("status") if isinstance(structured, dict) else None
-
-        # Work out canonical tool key so that start_* / get_* share one message.
-        canonical_key = call_id
-        if job_id:
-            root = state.job_roots.get(job_id)
-            if root is None:
-                state.job_roots[job_id] = call_id
-            else:
-                canonical_key = root
-
-        msg = state.tools_by_key.get(canonical_key)
-        if msg is None:
-            # We missed the functionCall; create the message on first response.
-            msg = ChatMessage(
-                role="assistant",
-                content="",
-                metadata={
-                    "title": title,
-                    "id": canonical_key,
-                },
-            )
-            state.tools_by_key[canonical_key] = msg
-            state.tool_order.append(canonical_key)
-
-        # Update metadata.
-        if msg.metadata is None:
-            msg.metadata = {}
-        msg.metadata["title"] = title
-        if status_value:
-            msg.metadata["status"] = "done" if status_value == "done" else "pending"
-        else:
-            msg.metadata["status"] = "done"
-
-        # Build a nice body depending on the tool.
-        if tool_name == "get_factual_memory":
-            msg.content = _format_get_factual_memory_body(response)
-        elif tool_name in ("start_media_retrieval", "get_media_retrieval_status"):
-            msg.content = _format_media_retrieval_body(structured)
-        elif tool_name in ("start_media_analysis", "get_media_analysis_result"):
-            # Increment fake progress ticks for long-running media analysis jobs
-            # so each poll animates the playful progress bar.
-            if status_value and status_value != "done":
-                state.fake_progress_ticks[canonical_key] = state.fake_progress_ticks.get(canonical_key, 0) + 1
-            ticks = state.fake_progress_ticks.get(canonical_key)
-            msg.content = _format_media_analysis_body(structured, progress_ticks=ticks)
-        elif tool_name in ("start_slide_extraction", "get_extracted_slides"):
-            # Summarize slide extraction in the tool message, but surface the
-            # actual slide images in the main assistant response instead of
-            # inside the thought.
-            slides = _normalize_slide_entries(structured or response)
-            if slides:
-                msg.content = f"Extracted {len(slides)} slides for this media."
-                # Emit images into the regular assistant turn.
-                lines: list[str] = [f"Detected {len(slides)} slides for this media."]
-                for slide in slides:
-                    uri = slide.get("image_data_uri")
-                    if not uri:
-                        continue
-                    index = slide.get("index")
-                    label = (slide.get("label") or "").strip()
-                    start = slide.get("from")
-                    end = slide.get("to")
-                    time_range = ""
-                    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
-                        time_range = f"{int(start)}s–{int(end)}s"
-                    caption_parts = []
-                    if index is not None:
-                        caption_parts.append(f"Slide #{index}")
-                    if label:
-                        caption_parts.append(label)
-                    if time_range:
-                        caption_parts.append(time_range)
-                    caption = " · ".join(caption_parts)
-
-                    img_md = _image_md_from_data_uri(uri, alt=f"Slide {index}")
-                    if img_md:
-                        lines.append("")
-                        lines.append(img_md)
-                    if caption:
-                        lines.append("")
-                        lines.append(caption)
-
-                # After returning the images, suppress any noisy assistant text
-                # the model might produce for this turn.
-                state.suppress_text = True
-                return "\n".join(lines)
-            else:
-                msg.content = "_No slides available for this media._"
-        elif tool_name == "translate_slide":
-            # Translate slide returns an ImageContent-like payload. Surface the
-            # translated image in the main assistant response and keep the tool
-            # message itself concise.
-            data_uri: str | None = None
-            if structured:
-                data_uri = _data_uri_from(structured)
-            if not data_uri and isinstance(response, dict):
-                content_items = response.get("content") or []
-                for item in content_items:
-                    if isinstance(item, dict) and item.get("type") == "image":
-                        data_uri = _data_uri_from(item)
-                        if data_uri:
-                            break
-
-            if data_uri:
-                img_md = _image_md_from_data_uri(data_uri, alt="Translated slide")
-                msg.content = "Translated slide image ready."
-                state.suppress_text = True
-                return img_md or "_Translated slide image available._"
-            else:
-                msg.content = "_Slide translation completed, but the image payload could not be decoded._"
-        else:
-            # Generic fallback for other tools: pretty-print payload but avoid
-            # overwhelming users with raw internals when possible.
-            inner = _parse_text_content(response)
-            if inner:
-                try:
-                    parsed = json.loads(inner)
-                    body = f"```json\n{_pretty_json(parsed)}\n```"
-                except Exception:
-                    body = inner
-            else:
-                body = f"```json\n{_pretty_json(response)}\n```"
-
-            msg.content = body
-
-        return None
+    for key, handler in _PART_HANDLERS:
+        payload = part.get(key)
+        if payload:
+            state.revision += 1
+            return handler(payload, state)
 
     # --- Plain text streaming chunks --------------------------------------
     if "text" in part:
@@ -630,4 +736,6 @@ def get_ordered_tool_messages(state: ToolDisplayState) -> list[ChatMessage]:
     """
     Return tool messages in first-seen order for display.
     """
-    return [state.tools_by_key[k] for k in state.tool_order if k in state.tools_by_key]
+    # _add_tool_message registers every key in both containers, so each
+    # ordered key is always present in tools_by_key.
+    return list(map(state.tools_by_key.__getitem__, state.tool_order))
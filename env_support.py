@@ -8,7 +8,7 @@ settings win) while providing a shared parser for the repository-level .env file
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+import re
 from pathlib import Path
 from typing import Dict
 
@@ -16,41 +16,49 @@ _PROJECT_ROOT = Path(__file__).resolve().parent
 _DEFAULT_ENV_PATH = _PROJECT_ROOT / ".env"
 
 
-def _strip_wrapper(value: str) -> str:
-    value = value.strip()
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
-        return value[1:-1]
-    return value
+# Optional `export ` prefix, then KEY = VALUE with surrounding whitespace trimmed.
+_ENV_LINE_RE = re.compile(r"^\s*(?:(?i:export )\s*)?([^#=\s][^=]*?)\s*=\s*(.*?)\s*$")
+_QUOTE_RE = re.compile(r"^(['\"])(.*)\1$", re.S)
 
 
 def _normalize_line(raw_line: str) -> tuple[str, str] | None:
-    line = raw_line.strip()
-    if not line or line.startswith("#"):
+    match = _ENV_LINE_RE.match(raw_line)
+    if match is None:
         return None
-    if line.lower().startswith("export "):
-        line = line[7:].strip()
-    if "=" not in line:
-        return None
-    key, value = line.split("=", 1)
-    key = key.strip()
-    if not key or key.startswith("#"):
-        return None
-    return key, _strip_wrapper(value)
+    key, value = match.groups()
+    quoted = _QUOTE_RE.match(value)
+    if quoted is not None:
+        value = quoted.group(2)
+    return key, value
+
+
+# (path, mtime_ns, size) -> parsed values, so edits to a .env file are picked up.
+_ENV_FILE_CACHE: Dict[tuple[str, int, int], Dict[str, str]] = {}
 
 
-@lru_cache(maxsize=8)
 def _parse_env_file(env_path: str) -> Dict[str, str]:
-    path = Path(env_path)
-    if not path.exists():
+    try:
+        stat = os.stat(env_path)
+    except OSError:
         return {}
 
+    cache_key = (env_path, stat.st_mtime_ns, stat.st_size)
+    cached = _ENV_FILE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     values: Dict[str, str] = {}
-    for raw_line in path.read_text().splitlines():
+    for raw_line in Path(env_path).read_text().splitlines():
         normalized = _normalize_line(raw_line)
         if not normalized:
             continue
         key, value = normalized
         values[key] = value
+
+    # Drop entries for older versions of this file.
+    for stale_key in [k for k in _ENV_FILE_CACHE if k[0] == env_path]:
+        del _ENV_FILE_CACHE[stale_key]
+    _ENV_FILE_CACHE[cache_key] = values
     return values
 
 
@@ -0,0 +1,48 @@
+import asyncio
+import unittest
+
+from chat_ui.backends.base import coalesce_partials
+
+
+def _partial(text: str) -> dict:
+    return {
+        "author": "assistant_agent",
+        "partial": True,
+        "content": {"parts": [{"text": text}]},
+    }
+
+
+async def _partials_then_error(*texts: str):
+    for text in texts:
+        yield _partial(text)
+    raise RuntimeError("stream broke")
+
+
+class CoalescePartialsTest(unittest.TestCase):
+    def test_merges_adjacent_partials(self) -> None:
+        async def source():
+            yield _partial("Hel")
+            yield _partial("lo")
+
+        async def collect() -> list[dict]:
+            return [event async for event in coalesce_partials(source(), max_delay=10)]
+
+        events = asyncio.run(collect())
+        self.assertEqual([e["content"]["parts"][0]["text"] for e in events], ["Hello"])
+
+    def test_flushes_pending_partials_before_source_error(self) -> None:
+        received: list[str] = []
+
+        async def consume() -> None:
+            async for event in coalesce_partials(
+                _partials_then_error("Hel", "lo"), max_delay=10
+            ):
+                received.append(event["content"]["parts"][0]["text"])
+
+        with self.assertRaisesRegex(RuntimeError, "stream broke"):
+            asyncio.run(consume())
+        self.assertEqual(received, ["Hello"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import importlib.util
+import unittest
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parent.parent / ".github" / "generate_welcome_readme.py"
+_spec = importlib.util.spec_from_file_location("generate_welcome_readme", _SCRIPT)
+generate_welcome_readme = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_welcome_readme)
+
+_ROOT = Path("/repo")
+_README = _ROOT / "README.md"
+_OUTPUT = _ROOT / ".github" / "README.md"
+
+
+def rewrite(raw: str) -> str:
+    return generate_welcome_readme.rewrite_links(raw, _README, _OUTPUT)
+
+
+class StripFrontmatterTest(unittest.TestCase):
+    def test_strips_frontmatter(self) -> None:
+        raw = "---\ntitle: x\n---\n# Title\n"
+        self.assertEqual(generate_welcome_readme.strip_frontmatter(raw), "# Title\n")
+
+    def test_empty_frontmatter_keeps_content_above_later_rule(self) -> None:
+        raw = "---\n---\n# Title\n\nintro\n\n---\n\nSection 2\n"
+        self.assertEqual(
+            generate_welcome_readme.strip_frontmatter(raw),
+            "# Title\n\nintro\n\n---\n\nSection 2\n",
+        )
+
+
+class RewriteLinksTest(unittest.TestCase):
+    def test_plain_link(self) -> None:
+        self.assertEqual(rewrite("see [docs](docs/guide.md)"), "see [docs](../docs/guide.md)")
+
+    def test_image_link(self) -> None:
+        self.assertEqual(
+            rewrite("![logo](readme_assets/logo.png)"),
+            "![logo](../readme_assets/logo.png)",
+        )
+
+    def test_target_with_balanced_parens(self) -> None:
+        self.assertEqual(rewrite("[x](docs/foo(1).md)"), "[x](../docs/foo(1).md)")
+
+    def test_unterminated_link_is_left_alone(self) -> None:
+        raw = "[x](docs/foo.md and [y](docs/bar(1.md"
+        self.assertEqual(rewrite(raw), raw)
+
+    def test_absolute_links_are_left_alone(self) -> None:
+        raw = "[a](https://example.com/x) [b](#anchor) [c](/root.md)"
+        self.assertEqual(rewrite(raw), raw)
+
+    def test_bracket_heavy_input_stays_fast(self) -> None:
+        raw = "[](" * 20000
+        self.assertEqual(rewrite(raw), raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,22 +4,38 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import vertexai
+from typing import TYPE_CHECKING, Any
 
 # Ensure project root (where env_support.py lives) is importable when this file is
 # invoked as `python tools/memory_bank_cli.py` from the repo root.
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
+if _PROJECT_ROOT_STR not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT_STR)
 
 from env_support import ensure_env_loaded
 
+if TYPE_CHECKING:
+    import vertexai
+
+try:  # optional fast path for pretty-printing large API payloads
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Upper bound on Memory Bank requests in flight at once.
+MAX_PARALLEL_REQUESTS = 8
+
+# key=value with both sides non-empty after trimming; splits at the first "=".
+KEY_VALUE_RE = re.compile(r"\s*([^=\s][^=]*?)\s*=\s*(\S.*?)\s*", re.S)
 
 DOMAIN_CLAIMS_TOPIC = {
     "custom_memory_topic": {
@@ -180,6 +196,26 @@ GENERATE_MEMORIES_EXAMPLES = [
     EXAMPLE_LOW_SIGNAL,
 ]
 
+MEMORY_BANK_CONFIG = {
+    "customization_configs": [
+        {
+            "memory_topics": MEMORY_TOPICS,
+            "generate_memories_examples": GENERATE_MEMORIES_EXAMPLES,
+        }
+    ],
+}
+
+
+def print_json(obj: Any, *, default: Any = None) -> None:
+    if orjson is not None:
+        try:
+            print(orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            return
+        except TypeError:
+            # Fall back for values orjson rejects (e.g. >64-bit ints).
+            pass
+    print(json.dumps(obj, indent=2, default=default))
+
 
 def ensure_setting(value: str | None, *, flag: str, env_name: str) -> str:
     if value:
@@ -190,7 +226,25 @@ def ensure_setting(value: str | None, *, flag: str, env_name: str) -> str:
     raise SystemExit(f"Missing required setting for {flag}; set {flag} or {env_name} in .env")
 
 
+# (project, location, api key) -> client, so repeated main() calls from a
+# wrapper script reuse credentials and connections.
+_client_cache: dict[tuple[str, str, str | None], vertexai.Client] = {}
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ThreadPoolExecutor:
+    """Return the worker pool shared by all subcommands, created on first use."""
+    executor = ThreadPoolExecutor(
+        max_workers=MAX_PARALLEL_REQUESTS, thread_name_prefix="memory-bank"
+    )
+    atexit.register(executor.shutdown, wait=True)
+    return executor
+
+
 def build_client(args: argparse.Namespace) -> tuple[vertexai.Client, str, str]:
+    # Imported here so --help and argument errors do not load the Cloud SDK.
+    import vertexai
+
     ensure_env_loaded(env_path=Path(args.env_file))
     project = ensure_setting(args.project, flag="--project", env_name="VERTEX_PROJECT_ID")
     requested_location = args.location or os.environ.get("VERTEX_LOCATION")
@@ -203,76 +257,76 @@ def build_client(args: argparse.Namespace) -> tuple[vertexai.Client, str, str]:
                 "Missing required setting for --location; set --location or "
                 "VERTEX_LOCATION in .env when using an API key."
             )
-        vertexai.init(project=project, location=requested_location)
-        return vertexai.Client(api_key=api_key), project, requested_location
-
-    # ADC path: rely on user-provided project/location and default credentials.
-    if not requested_location:
+    elif not requested_location:
+        # ADC path: rely on user-provided project/location and default credentials.
         raise SystemExit("Missing required setting for --location; set --location or VERTEX_LOCATION in .env")
-    vertexai.init(project=project, location=requested_location)
-    return vertexai.Client(project=project, location=requested_location), project, requested_location
 
-
-def build_memory_bank_config(project: str, location: str) -> dict[str, Any]:
-    return {
-        "customization_configs": [
-            {
-                "memory_topics": MEMORY_TOPICS,
-                "generate_memories_examples": GENERATE_MEMORIES_EXAMPLES,
-            }
-        ],
-    }
+    key = (project, requested_location, api_key or None)
+    client = _client_cache.get(key)
+    if client is None:
+        vertexai.init(project=project, location=requested_location)
+        if api_key:
+            client = vertexai.Client(api_key=api_key)
+        else:
+            client = vertexai.Client(project=project, location=requested_location)
+        _client_cache[key] = client
+    return client, project, requested_location
 
 
 def parse_labels(raw: list[str] | None) -> dict[str, str]:
     labels: dict[str, str] = {}
     for item in raw or []:
-        if "=" not in item:
-            raise SystemExit(f"Invalid label '{item}'. Expected key=value format.")
-        key, value = item.split("=", 1)
-        key = key.strip().lower()
-        value = value.strip().lower()
-        if not key or not value:
+        match = KEY_VALUE_RE.fullmatch(item)
+        if match is None:
+            if "=" not in item:
+                raise SystemExit(f"Invalid label '{item}'. Expected key=value format.")
             raise SystemExit(f"Invalid label '{item}'.")
-        labels[key] = value
+        key, value = match.groups()
+        labels[key.lower()] = value.lower()
     return labels
 
 
+def get_nested_attr(obj: Any, *attrs: str) -> Any:
+    """Follow attrs from obj, returning None as soon as one is missing or None."""
+    for attr in attrs:
+        obj = getattr(obj, attr, None)
+        if obj is None:
+            return None
+    return obj
+
+
 def create_memory_bank(args: argparse.Namespace) -> None:
-    client, project, location = build_client(args)
+    client, _, _ = build_client(args)
     config: dict[str, Any] = {
         "display_name": args.display_name or "Aileen Memory Bank",
         "description": args.description or "Vertex Agent Engine for Aileen factual memory storage",
-        "context_spec": {"memory_bank_config": build_memory_bank_config(project, location)},
+        "context_spec": {"memory_bank_config": MEMORY_BANK_CONFIG},
     }
     labels = parse_labels(args.label)
     if labels:
         config["labels"] = labels
 
     engine = client.agent_engines.create(config=config)
-    api_resource = getattr(engine, "api_resource", None)
-    name = getattr(api_resource, "name", None)
+    name = get_nested_attr(engine, "api_resource", "name")
     print("Created Vertex Agent Engine with memory bank.")
     print(f"resource name: {name or '(not returned)'}")
-    if api_resource and getattr(api_resource, "spec", None):
-        context_spec = getattr(api_resource.spec, "context_spec", None)
-        if context_spec:
-            print("Context spec preview:")
-            print(json.dumps(context_spec, indent=2))
+    context_spec = get_nested_attr(engine, "api_resource", "spec", "context_spec")
+    if context_spec:
+        print("Context spec preview:")
+        print_json(context_spec)
     print("Store this resource name as AGENT_ENGINE_NAME in your .env before using the chat UI.")
 
 
 def configure_memory_bank(args: argparse.Namespace) -> None:
-    client, project, location = build_client(args)
+    client, _, _ = build_client(args)
     engine_name = ensure_setting(args.engine, flag="--engine", env_name="AGENT_ENGINE_NAME")
-    config = {"context_spec": {"memory_bank_config": build_memory_bank_config(project, location)}}
+    config = {"context_spec": {"memory_bank_config": MEMORY_BANK_CONFIG}}
     engine = client.agent_engines.update(name=engine_name, config=config)
     print(f"Memory bank configuration applied to {engine_name}.")
-    spec = getattr(getattr(engine, "api_resource", None), "spec", None)
-    context_spec = getattr(spec, "context_spec", None)
+    context_spec = get_nested_attr(engine, "api_resource", "spec", "context_spec")
     if context_spec is not None:
         print("Updated context spec:")
-        print(json.dumps(context_spec, indent=2))
+        print_json(context_spec)
 
 
 def delete_memory_bank(args: argparse.Namespace) -> None:
@@ -280,9 +334,8 @@ def delete_memory_bank(args: argparse.Namespace) -> None:
     engine_name = ensure_setting(args.engine, flag="--engine", env_name="AGENT_ENGINE_NAME")
     engine = client.agent_engines.update(name=engine_name, config={"context_spec": {}})
     print(f"Memory bank configuration removed from {engine_name}.")
-    spec = getattr(getattr(engine, "api_resource", None), "spec", None)
-    context_spec = getattr(spec, "context_spec", None)
-    print(json.dumps(context_spec or {}, indent=2))
+    context_spec = get_nested_attr(engine, "api_resource", "spec", "context_spec")
+    print_json(context_spec or {})
 
 
 def parse_scope(args: argparse.Namespace) -> dict[str, str]:
@@ -292,13 +345,12 @@ def parse_scope(args: argparse.Namespace) -> dict[str, str]:
     if args.user_id:
         scope["user_id"] = args.user_id
     for item in args.scope or []:
-        if "=" not in item:
-            raise SystemExit(f"Invalid scope entry '{item}'. Expected key=value format.")
-        key, value = item.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        if not key or not value:
+        match = KEY_VALUE_RE.fullmatch(item)
+        if match is None:
+            if "=" not in item:
+                raise SystemExit(f"Invalid scope entry '{item}'. Expected key=value format.")
             raise SystemExit(f"Invalid scope entry '{item}'.")
+        key, value = match.groups()
         scope[key] = value
     if not scope:
         raise SystemExit("Provide at least one scope key via --app-name/--user-id or --scope key=value.")
@@ -313,21 +365,33 @@ def add_facts(args: argparse.Namespace) -> None:
     if args.fact:
         facts.extend([value.strip() for value in args.fact if value and value.strip()])
     if args.facts_file:
-        for line in Path(args.facts_file).read_text().splitlines():
-            cleaned = line.strip()
-            if cleaned:
-                facts.append(cleaned)
+        # Iterate the file instead of splitting one big string, so only the
+        # kept facts stay in memory.
+        with open(args.facts_file) as facts_file:
+            for line in facts_file:
+                cleaned = line.strip()
+                if cleaned:
+                    facts.append(cleaned)
     if not facts:
         raise SystemExit("No facts provided. Use --fact or --facts-file.")
+    # Each duplicate would cost a full create call; keep the first occurrence.
+    unique_facts = list(dict.fromkeys(facts))
+    if len(unique_facts) < len(facts):
+        print(f"Skipping {len(facts) - len(unique_facts)} duplicate fact(s).")
+    facts = unique_facts
 
-    for fact in facts:
+    def store(fact: str) -> str:
         operation = client.agent_engines.memories.create(
             name=engine_name,
             fact=fact,
             scope=scope,
             config={"wait_for_completion": True},
         )
-        memory_name = operation.response.name if operation.response else "(pending)"
+        return operation.response.name if operation.response else "(pending)"
+
+    # Each create blocks on a network round trip and a server-side operation,
+    # so overlap them; results are still reported in input order.
+    for memory_name in get_executor().map(store, facts):
         print(f"Stored fact -> {memory_name}")
 
 
@@ -350,23 +414,34 @@ def generate_memories(args: argparse.Namespace) -> None:
     client, _, _ = build_client(args)
     engine_name = ensure_setting(args.engine, flag="--engine", env_name="AGENT_ENGINE_NAME")
     scope = parse_scope(args)
-    text = args.text
     if args.text_file:
-        text = Path(args.text_file).read_text().strip()
-    if not text:
+        sources = [(path, Path(path).read_text().strip()) for path in args.text_file]
+    else:
+        sources = [(None, args.text)]
+    if not all(text for _, text in sources):
         raise SystemExit("Provide conversation text via --text or --text-file.")
 
-    operation = client.agent_engines.memories.generate(
-        name=engine_name,
-        direct_contents_source={"events": build_events_from_text(text)},
-        scope=scope,
-        config={"wait_for_completion": True},
-    )
-    response = operation.response or {}
-    print("Generated memories response:")
-    print(json.dumps(response, indent=2, default=str))
+    def generate(text: str) -> Any:
+        operation = client.agent_engines.memories.generate(
+            name=engine_name,
+            direct_contents_source={"events": build_events_from_text(text)},
+            scope=scope,
+            config={"wait_for_completion": True},
+        )
+        return operation.response or {}
 
+    # Extraction runs server-side and each call waits for its operation, so
+    # submit all texts at once and report in the order they were given.
+    responses = get_executor().map(generate, [text for _, text in sources])
+    for (path, _), response in zip(sources, responses):
+        if path is None:
+            print("Generated memories response:")
+        else:
+            print(f"Generated memories response for {path}:")
+        print_json(response, default=str)
 
+
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--env-file", default=".env", help="Path to .env containing VERTEX_API_KEY")
@@ -412,7 +487,11 @@ def build_parser() -> argparse.ArgumentParser:
         help="Generate memories from raw conversation text via Vertex auto extraction",
     )
     generate.add_argument("--text", help="Inline conversation text")
-    generate.add_argument("--text-file", help="File containing conversation text")
+    generate.add_argument(
+        "--text-file",
+        action="append",
+        help="File containing conversation text (repeatable; files are processed concurrently)",
+    )
     generate.add_argument("--app-name", help="Scope app_name value")
     generate.add_argument("--user-id", help="Scope user_id value")
     generate.add_argument(